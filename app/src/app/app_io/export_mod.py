@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+import csv
 import json
 from typing import TYPE_CHECKING
 
@@ -24,17 +25,25 @@ def export_csv(app: "MeasureAppGUI") -> None:
     if not path:
         return
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write('polygon_id,area,perimeter,metadata\n')
-            for idx, poly in enumerate(app.polygons, start=1):
-                area_real = poly.area_px * (app.scale_factor ** 2)
-                perim_real = poly.perimeter_px * app.scale_factor
-                meta_str = json.dumps(poly.metadata)
-                f.write(f'{idx},{area_real},{perim_real},"{meta_str}"\n')
+        # Hoist the scale conversion out of the loop and hand the rows to
+        # csv.writer in one call; the writer also handles quoting, so
+        # metadata containing quotes no longer breaks the file.
+        sf = app.scale_factor
+        sf2 = sf * sf
+        rows = [
+            (idx, poly.area_px * sf2, poly.perimeter_px * sf,
+             json.dumps(poly.metadata, separators=(',', ':')))
+            for idx, poly in enumerate(app.polygons, start=1)
+        ]
+        # 1 MB buffer so large exports are flushed in a few syscalls
+        with open(path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(('polygon_id', 'area', 'perimeter', 'metadata'))
+            writer.writerows(rows)
         if messagebox:
             messagebox.showinfo("Export", "Measurements exported successfully.")
     except Exception as e:
         if messagebox:
             messagebox.showerror("Error", f"Failed to export CSV: {e}")
 
-
+
@@ -27,24 +27,24 @@ except Exception:
     )
 
 # Draw
-try:
-    from ..features.editing.draw import (
-        set_draw_mode as draw_set_mode,
-        draw_on_canvas_click as draw_on_canvas_click,
-        draw_on_motion as draw_on_motion,
-        clear_draw_preview as draw_clear_preview,
-        finish_polygon as draw_finish,
-        edit_polygon_metadata as metadata_edit,
-    )
-except Exception:
-    from features.editing.draw import (
-        set_draw_mode as draw_set_mode,
-        draw_on_canvas_click as draw_on_canvas_click,
-        draw_on_motion as draw_on_motion,
-        clear_draw_preview as draw_clear_preview,
-        finish_polygon as draw_finish,
-        edit_polygon_metadata as metadata_edit,
-    )
+try:
+    from ..features.editing.draw import (
+        set_draw_mode as draw_set_mode,
+        draw_on_canvas_click as draw_on_canvas_click,
+        draw_on_motion as draw_on_motion,
+        clear_draw_preview as draw_clear_preview,
+        finish_polygon as draw_finish,
+        edit_polygon_metadata as metadata_edit,
+    )
+except Exception:
+    from features.editing.draw import (
+        set_draw_mode as draw_set_mode,
+        draw_on_canvas_click as draw_on_canvas_click,
+        draw_on_motion as draw_on_motion,
+        clear_draw_preview as draw_clear_preview,
+        finish_polygon as draw_finish,
+        edit_polygon_metadata as metadata_edit,
+    )
 
 # File I/O
 try:
@@ -78,12 +78,14 @@ try:
         pan_canvas as pan_canvas,
         on_pan_start as pan_on_start,
         on_pan_move as pan_on_move,
+        on_pan_end as pan_on_end,
     )
 except Exception:
     from features.navigation.pan import (
         pan_canvas as pan_canvas,
         on_pan_start as pan_on_start,
         on_pan_move as pan_on_move,
+        on_pan_end as pan_on_end,
     )
 
 try:
@@ -91,12 +93,18 @@ try:
         zoom_in as zoom_in,
         zoom_out as zoom_out,
         set_zoom as zoom_set,
+        rotated_base as zoom_rotated_base,
+        render_viewport_tile as zoom_render_tile,
+        schedule_viewport_refresh as zoom_refresh_tile,
     )
 except Exception:
     from features.navigation.zoom import (
         zoom_in as zoom_in,
         zoom_out as zoom_out,
         set_zoom as zoom_set,
+        rotated_base as zoom_rotated_base,
+        render_viewport_tile as zoom_render_tile,
+        schedule_viewport_refresh as zoom_refresh_tile,
     )
 
 try:
@@ -113,20 +121,20 @@ except Exception:
     )
 
 # Dragging
-try:
-    from ..features.editing.drag import (
-        on_drag_start as drag_start,
-        on_drag_move as drag_move,
-        on_drag_end as drag_end,
-        undo_last_vertex_move as drag_undo,
-    )
-except Exception:
-    from features.editing.drag import (
-        on_drag_start as drag_start,
-        on_drag_move as drag_move,
-        on_drag_end as drag_end,
-        undo_last_vertex_move as drag_undo,
-    )
+try:
+    from ..features.editing.drag import (
+        on_drag_start as drag_start,
+        on_drag_move as drag_move,
+        on_drag_end as drag_end,
+        undo_last_vertex_move as drag_undo,
+    )
+except Exception:
+    from features.editing.drag import (
+        on_drag_start as drag_start,
+        on_drag_move as drag_move,
+        on_drag_end as drag_end,
+        undo_last_vertex_move as drag_undo,
+    )
 
 # Straighten
 try:
@@ -0,0 +1,453 @@
+from __future__ import annotations
+
+"""
+Optional compiled fast paths for hot geometry routines.
+
+Numba is not a hard dependency of the app; when it (or NumPy) is missing
+the pure-Python implementations below are used instead, so callers never
+need to care which path is active.
+"""
+
+import math
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+try:
+    from numba import njit
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+
+
+def _vertex_angles_py(points: Sequence[Tuple[float, float]]) -> List[float]:
+    """Absolute turn angle (degrees) at each vertex of a closed polygon."""
+    n = len(points)
+    out = [0.0] * n
+    atan2 = math.atan2
+    degrees = math.degrees
+    for i in range(n):
+        x, y = points[i]
+        x_prev, y_prev = points[i - 1]
+        x_next, y_next = points[(i + 1) % n]
+        v1x = x - x_prev
+        v1y = y - y_prev
+        v2x = x_next - x
+        v2y = y_next - y
+        dot = v1x * v2x + v1y * v2y
+        det = v1x * v2y - v1y * v2x
+        out[i] = abs(degrees(atan2(det, dot)))
+    return out
+
+
+def _right_angle_mask_py(points: Sequence[Tuple[float, float]], tol_deg: float) -> List[bool]:
+    """True where the vertex angle is within ``tol_deg`` of 90 degrees.
+
+    Uses |dot| <= sin(tol)*|v1||v2| instead of atan2/degrees: the
+    classification is identical but needs no transcendental per vertex.
+    """
+    thresh = math.sin(math.radians(tol_deg))
+    n = len(points)
+    out = [False] * n
+    sqrt = math.sqrt
+    for i in range(n):
+        x, y = points[i]
+        x_prev, y_prev = points[i - 1]
+        x_next, y_next = points[(i + 1) % n]
+        v1x = x - x_prev
+        v1y = y - y_prev
+        v2x = x_next - x
+        v2y = y_next - y
+        dot = v1x * v2x + v1y * v2y
+        norm2 = (v1x * v1x + v1y * v1y) * (v2x * v2x + v2y * v2y)
+        out[i] = abs(dot) <= thresh * sqrt(norm2)
+    return out
+
+
+def _vertex_angles_np(points: Sequence[Tuple[float, float]]):
+    """Vectorized turn angles: one NumPy pass instead of N atan2 calls."""
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    v1 = pts - np.roll(pts, 1, axis=0)
+    v2 = np.roll(pts, -1, axis=0) - pts
+    dot = (v1 * v2).sum(axis=1)
+    det = v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]
+    return np.abs(np.degrees(np.arctan2(det, dot)))
+
+
+def _right_angle_mask_np(points: Sequence[Tuple[float, float]], tol_deg: float):
+    """Vectorized sin-threshold right-angle classification."""
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    v1 = pts - np.roll(pts, 1, axis=0)
+    v2 = np.roll(pts, -1, axis=0) - pts
+    dot = (v1 * v2).sum(axis=1)
+    norm2 = (v1 * v1).sum(axis=1) * (v2 * v2).sum(axis=1)
+    thresh = math.sin(math.radians(tol_deg))
+    return np.abs(dot) <= thresh * np.sqrt(norm2)
+
+
+def points_in_polygon_batch(points, polygon):
+    """Test many query points against one polygon in a single ray cast.
+
+    With NumPy the crossing test broadcasts every point against every edge
+    at once; the return value is a boolean array (or list, in the scalar
+    fallback) aligned with ``points``.
+    """
+    if np is None or len(polygon) < 3:
+        return [_point_in_polygon_py(p[0], p[1], polygon) for p in points]
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    poly = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+    if HAS_NUMBA:
+        return _pip_batch_nb(np.ascontiguousarray(pts), np.ascontiguousarray(poly))
+    x1 = poly[:, 0]
+    y1 = poly[:, 1]
+    x2 = np.roll(x1, -1)
+    y2 = np.roll(y1, -1)
+    cx = pts[:, 0][:, None]
+    cy = pts[:, 1][:, None]
+    cond = (y1 > cy) != (y2 > cy)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xint = x1 + (cy - y1) * (x2 - x1) / (y2 - y1)
+    crossings = (cond & (cx < xint)).sum(axis=1)
+    return (crossings & 1).astype(bool)
+
+
+def _point_in_polygon_py(px: float, py: float, polygon: Sequence[Tuple[float, float]]) -> bool:
+    """Franklin's PNPOLY ray cast over the polygon edges."""
+    n = len(polygon)
+    if n < 3:
+        return False
+    inside = False
+    j = n - 1
+    for i in range(n):
+        yi = polygon[i][1]
+        yj = polygon[j][1]
+        if (yi > py) != (yj > py):
+            xi = polygon[i][0]
+            xj = polygon[j][0]
+            if px < (xj - xi) * (py - yi) / (yj - yi) + xi:
+                inside = not inside
+        j = i
+    return inside
+
+
+def simplify_polyline(points, eps: float, max_n: int = 200):
+    """Douglas-Peucker simplification with an epsilon and a vertex cap.
+
+    Runs iteratively with an explicit stack (no recursion limit concerns
+    for traced outlines with thousands of vertices). If the epsilon pass
+    still leaves more than ``max_n`` vertices, epsilon is doubled and the
+    pass repeated, so the result is bounded regardless of input density.
+    Intended for display-only copies; callers keep the raw points for
+    metrics and hit testing.
+    """
+    pts = [(float(p[0]), float(p[1])) for p in points]
+    n = len(pts)
+    if n <= 4 or n <= max_n and eps <= 0.0:
+        return pts
+    for _ in range(16):
+        keep = [False] * n
+        keep[0] = keep[n - 1] = True
+        kept = 2
+        stack = [(0, n - 1)]
+        while stack:
+            i, j = stack.pop()
+            if j <= i + 1:
+                continue
+            ax, ay = pts[i]
+            bx, by = pts[j]
+            dx = bx - ax
+            dy = by - ay
+            norm = math.hypot(dx, dy)
+            best = -1.0
+            best_k = -1
+            for k in range(i + 1, j):
+                px, py = pts[k]
+                if norm < 1e-12:
+                    d = math.hypot(px - ax, py - ay)
+                else:
+                    d = abs(dy * (px - ax) - dx * (py - ay)) / norm
+                if d > best:
+                    best = d
+                    best_k = k
+            if best > eps and best_k > 0:
+                keep[best_k] = True
+                kept += 1
+                stack.append((i, best_k))
+                stack.append((best_k, j))
+        if kept <= max_n:
+            return [pts[i] for i in range(n) if keep[i]]
+        eps = eps * 2.0 if eps > 0.0 else 0.5
+    return [pts[i] for i in range(n) if keep[i]]
+
+
+# True when the compiled kernels below are in use.
+HAS_NUMBA = njit is not None and np is not None
+
+if njit is not None and np is not None:
+
+    @njit(cache=True)
+    def _vertex_angles_nb(pts):  # pragma: no cover - compiled
+        n = pts.shape[0]
+        out = np.empty(n)
+        for i in range(n):
+            x = pts[i, 0]
+            y = pts[i, 1]
+            x_prev = pts[i - 1, 0]
+            y_prev = pts[i - 1, 1]
+            nxt = i + 1 if i + 1 < n else 0
+            x_next = pts[nxt, 0]
+            y_next = pts[nxt, 1]
+            v1x = x - x_prev
+            v1y = y - y_prev
+            v2x = x_next - x
+            v2y = y_next - y
+            dot = v1x * v2x + v1y * v2y
+            det = v1x * v2y - v1y * v2x
+            out[i] = abs(math.degrees(math.atan2(det, dot)))
+        return out
+
+    @njit(cache=True)
+    def _right_angle_mask_nb(pts, thresh):  # pragma: no cover - compiled
+        n = pts.shape[0]
+        out = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            x = pts[i, 0]
+            y = pts[i, 1]
+            x_prev = pts[i - 1, 0]
+            y_prev = pts[i - 1, 1]
+            nxt = i + 1 if i + 1 < n else 0
+            x_next = pts[nxt, 0]
+            y_next = pts[nxt, 1]
+            v1x = x - x_prev
+            v1y = y - y_prev
+            v2x = x_next - x
+            v2y = y_next - y
+            dot = v1x * v2x + v1y * v2y
+            norm2 = (v1x * v1x + v1y * v1y) * (v2x * v2x + v2y * v2y)
+            out[i] = abs(dot) <= thresh * math.sqrt(norm2)
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _metrics_nb(pts):  # pragma: no cover - compiled
+        n = pts.shape[0]
+        a = 0.0
+        p = 0.0
+        x0 = pts[n - 1, 0]
+        y0 = pts[n - 1, 1]
+        for i in range(n):
+            x1 = pts[i, 0]
+            y1 = pts[i, 1]
+            a += x0 * y1 - x1 * y0
+            dx = x1 - x0
+            dy = y1 - y0
+            p += math.sqrt(dx * dx + dy * dy)
+            x0 = x1
+            y0 = y1
+        return abs(a) * 0.5, p
+
+    def polygon_metrics(points) -> Tuple[float, float]:
+        """Area and perimeter in one fused pass over the vertex array."""
+        if len(points) < 3:
+            return 0.0, 0.0
+        arr = np.ascontiguousarray(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+        area, perim = _metrics_nb(arr)
+        return float(area), float(perim)
+
+    @njit(cache=True, fastmath=True)
+    def _centroid_nb(pts):  # pragma: no cover - compiled
+        n = pts.shape[0]
+        double_area = 0.0
+        cx = 0.0
+        cy = 0.0
+        x0 = pts[n - 1, 0]
+        y0 = pts[n - 1, 1]
+        for i in range(n):
+            x1 = pts[i, 0]
+            y1 = pts[i, 1]
+            cross = x0 * y1 - x1 * y0
+            double_area += cross
+            cx += (x0 + x1) * cross
+            cy += (y0 + y1) * cross
+            x0 = x1
+            y0 = y1
+        return cx, cy, double_area
+
+    def polygon_centroid(points) -> Tuple[float, float]:
+        """Area-weighted centroid; vertex mean when the area vanishes."""
+        arr = np.ascontiguousarray(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+        cx, cy, double_area = _centroid_nb(arr)
+        if abs(double_area) < 2e-9:
+            mean = arr.mean(axis=0)
+            return float(mean[0]), float(mean[1])
+        scale = 1.0 / (3.0 * double_area)
+        return cx * scale, cy * scale
+
+    @njit(cache=True, fastmath=True)
+    def _pip_nb(px, py, poly):  # pragma: no cover - compiled
+        n = poly.shape[0]
+        inside = False
+        j = n - 1
+        for i in range(n):
+            yi = poly[i, 1]
+            yj = poly[j, 1]
+            if (yi > py) != (yj > py):
+                xi = poly[i, 0]
+                xj = poly[j, 0]
+                if px < (xj - xi) * (py - yi) / (yj - yi) + xi:
+                    inside = not inside
+            j = i
+        return inside
+
+    @njit(cache=True, fastmath=True)
+    def _grid_corner_counts_nb(min_x, min_y, cols, rows, pw, ph, poly):  # pragma: no cover - compiled
+        out = np.empty(cols * rows, dtype=np.int8)
+        k = 0
+        for c in range(cols):
+            rx = min_x + c * pw
+            for r in range(rows):
+                ry = min_y + r * ph
+                cnt = 0
+                if _pip_nb(rx, ry, poly):
+                    cnt += 1
+                if _pip_nb(rx + pw, ry, poly):
+                    cnt += 1
+                if _pip_nb(rx + pw, ry + ph, poly):
+                    cnt += 1
+                if _pip_nb(rx, ry + ph, poly):
+                    cnt += 1
+                out[k] = cnt
+                k += 1
+        return out
+
+    def grid_corner_counts(min_x: float, min_y: float, cols: int, rows: int,
+                           pw: float, ph: float, polygon):
+        """Inside-corner count (0-4) for each cell of a tile grid.
+
+        Fuses grid generation with the containment test: cell corners are
+        produced on the fly inside the kernel instead of materializing a
+        4*K point array first. Cells are ordered column-major to match
+        the layout generator's iteration order.
+        """
+        poly = np.ascontiguousarray(np.asarray(polygon, dtype=np.float64).reshape(-1, 2))
+        return _grid_corner_counts_nb(min_x, min_y, cols, rows, pw, ph, poly)
+
+    @njit(cache=True, fastmath=True)
+    def _pip_batch_nb(pts, poly):  # pragma: no cover - compiled
+        m = pts.shape[0]
+        out = np.empty(m, dtype=np.bool_)
+        for k in range(m):
+            out[k] = _pip_nb(pts[k, 0], pts[k, 1], poly)
+        return out
+
+    def point_in_polygon(px: float, py: float, polygon) -> bool:
+        if len(polygon) < 3:
+            return False
+        arr = np.ascontiguousarray(np.asarray(polygon, dtype=np.float64).reshape(-1, 2))
+        return bool(_pip_nb(px, py, arr))
+
+    def vertex_angles(points: Sequence[Tuple[float, float]]) -> Sequence[float]:
+        if len(points) == 0:
+            return []
+        arr = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return _vertex_angles_nb(arr)
+
+    def right_angle_mask(points: Sequence[Tuple[float, float]], tol_deg: float = 8.0) -> Sequence[bool]:
+        if len(points) == 0:
+            return []
+        arr = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return _right_angle_mask_nb(arr, math.sin(math.radians(tol_deg)))
+
+    def warmup() -> None:
+        """Trigger JIT compilation so interactive paths never pay it."""
+        tri = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+        vertex_angles(tri)
+        right_angle_mask(tri)
+        point_in_polygon(0.25, 0.25, tri)
+        polygon_metrics(tri)
+        points_in_polygon_batch([(0.25, 0.25)], tri)
+        grid_corner_counts(0.0, 0.0, 1, 1, 0.5, 0.5, tri)
+        polygon_centroid(tri)
+
+else:
+
+    def point_in_polygon(px: float, py: float, polygon) -> bool:
+        if np is not None and len(polygon) >= 3:
+            # One vectorized crossing test over all edges instead of a
+            # Python walk per edge.
+            poly = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+            x1 = poly[:, 0]
+            y1 = poly[:, 1]
+            x2 = np.roll(x1, -1)
+            y2 = np.roll(y1, -1)
+            cond = (y1 > py) != (y2 > py)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                xint = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+            return bool(int((cond & (px < xint)).sum()) & 1)
+        return _point_in_polygon_py(px, py, polygon)
+
+    def polygon_metrics(points) -> Tuple[float, float]:
+        """Area and perimeter; falls back to the model's own routines."""
+        if len(points) < 3:
+            return 0.0, 0.0
+        n = len(points)
+        a = 0.0
+        p = 0.0
+        x0, y0 = points[n - 1][0], points[n - 1][1]
+        for i in range(n):
+            x1, y1 = points[i][0], points[i][1]
+            a += x0 * y1 - x1 * y0
+            dx = x1 - x0
+            dy = y1 - y0
+            p += math.sqrt(dx * dx + dy * dy)
+            x0, y0 = x1, y1
+        return abs(a) * 0.5, p
+
+    def polygon_centroid(points) -> Tuple[float, float]:
+        """Area-weighted centroid; vertex mean when the area vanishes."""
+        double_area = 0.0
+        cx = 0.0
+        cy = 0.0
+        x0, y0 = points[-1][0], points[-1][1]
+        for p in points:
+            x1, y1 = p[0], p[1]
+            cross = x0 * y1 - x1 * y0
+            double_area += cross
+            cx += (x0 + x1) * cross
+            cy += (y0 + y1) * cross
+            x0, y0 = x1, y1
+        if abs(double_area) < 2e-9:
+            n = len(points)
+            return (sum(p[0] for p in points) / n,
+                    sum(p[1] for p in points) / n)
+        scale = 1.0 / (3.0 * double_area)
+        return cx * scale, cy * scale
+
+    def grid_corner_counts(min_x: float, min_y: float, cols: int, rows: int,
+                           pw: float, ph: float, polygon):
+        """Inside-corner count (0-4) per grid cell via the batch ray cast."""
+        corners: List[Tuple[float, float]] = []
+        for c in range(cols):
+            rx = min_x + c * pw
+            for r in range(rows):
+                ry = min_y + r * ph
+                corners.extend(((rx, ry), (rx + pw, ry),
+                                (rx + pw, ry + ph), (rx, ry + ph)))
+        inside = points_in_polygon_batch(corners, polygon)
+        if np is not None:
+            return np.asarray(inside).reshape(-1, 4).sum(axis=1)
+        return [sum(inside[k * 4:k * 4 + 4]) for k in range(cols * rows)]
+
+    def vertex_angles(points: Sequence[Tuple[float, float]]) -> Sequence[float]:
+        if np is not None and len(points) > 0:
+            return _vertex_angles_np(points)
+        return _vertex_angles_py(points)
+
+    def right_angle_mask(points: Sequence[Tuple[float, float]], tol_deg: float = 8.0) -> Sequence[bool]:
+        if np is not None and len(points) > 0:
+            return _right_angle_mask_np(points, tol_deg)
+        return _right_angle_mask_py(points, tol_deg)
+
+    def warmup() -> None:
+        pass
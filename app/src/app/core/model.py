@@ -4,11 +4,31 @@ import math
 from dataclasses import dataclass, field
 from typing import List, Tuple
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
 
-def shoelace_area(points: List[Tuple[float, float]]) -> float:
-    """Return the absolute area of a polygon using the shoelace formula."""
+try:
+    from . import fastgeom
+except Exception:  # pragma: no cover
+    import fastgeom  # type: ignore
+
+
+def shoelace_area(points) -> float:
+    """Return the absolute area of a polygon using the shoelace formula.
+
+    Accepts either a list of (x, y) tuples or an ``(n, 2)`` float array;
+    with NumPy available the sum collapses to two dot products instead of
+    a Python-level loop over every vertex.
+    """
     if len(points) < 3:
         return 0.0
+    if np is not None:
+        pts = np.asarray(points, dtype=np.float64)
+        x = pts[:, 0]
+        y = pts[:, 1]
+        return 0.5 * abs(x @ np.roll(y, -1) - y @ np.roll(x, -1))
     area = 0.0
     n = len(points)
     for i in range(n):
@@ -18,10 +38,14 @@ def shoelace_area(points: List[Tuple[float, float]]) -> float:
     return abs(area) / 2.0
 
 
-def polygon_perimeter(points: List[Tuple[float, float]]) -> float:
+def polygon_perimeter(points) -> float:
     """Return the perimeter length of a polygon."""
     if len(points) < 2:
         return 0.0
+    if np is not None:
+        pts = np.asarray(points, dtype=np.float64)
+        d = np.diff(pts, axis=0, append=pts[:1])
+        return float(np.hypot(d[:, 0], d[:, 1]).sum())
     perim = 0.0
     n = len(points)
     for i in range(n):
@@ -31,35 +55,208 @@ def polygon_perimeter(points: List[Tuple[float, float]]) -> float:
     return perim
 
 
-def point_in_polygon(pt: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
-    """Ray casting algorithm to determine if a point lies within a polygon."""
-    x, y = pt
-    inside = False
-    n = len(polygon)
-    if n < 3:
+def polygon_centroid(points) -> "Tuple[float, float] | None":
+    """Return the area-weighted centroid of a polygon.
+
+    Falls back to the plain vertex average when the signed area is near
+    zero (degenerate or self-cancelling rings). Accepts a list of
+    (x, y) tuples or an ``(n, 2)`` float array.
+    """
+    n = len(points)
+    if n == 0:
+        return None
+    if fastgeom.HAS_NUMBA and n >= 3:
+        return fastgeom.polygon_centroid(points)
+    if np is not None:
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        x = pts[:, 0]
+        y = pts[:, 1]
+        x1 = np.roll(x, -1)
+        y1 = np.roll(y, -1)
+        cross = x * y1 - x1 * y
+        area = cross.sum() / 2.0
+        if abs(area) < 1e-9:
+            avg = pts.mean(axis=0)
+            return (float(avg[0]), float(avg[1]))
+        return (float(((x + x1) @ cross) / (6.0 * area)),
+                float(((y + y1) @ cross) / (6.0 * area)))
+    # Single pass carrying the previous vertex forward: no modulo or
+    # second tuple index per edge, and one reciprocal multiply at the end
+    # replaces the two divisions by 6*area.
+    double_area = 0.0
+    cx_acc = 0.0
+    cy_acc = 0.0
+    x0, y0 = points[-1]
+    for x1, y1 in points:
+        cross = x0 * y1 - x1 * y0
+        double_area += cross
+        cx_acc += (x0 + x1) * cross
+        cy_acc += (y0 + y1) * cross
+        x0, y0 = x1, y1
+    if abs(double_area) < 2e-9:
+        avg_x = sum(p[0] for p in points) / n
+        avg_y = sum(p[1] for p in points) / n
+        return (avg_x, avg_y)
+    scale = 1.0 / (3.0 * double_area)
+    return (cx_acc * scale, cy_acc * scale)
+
+
+def point_in_polygon(pt: Tuple[float, float], polygon) -> bool:
+    """Ray casting test; dispatches to the compiled kernel when available."""
+    if len(polygon) < 3:
         return False
-    p1x, p1y = polygon[0]
-    for i in range(n + 1):
-        p2x, p2y = polygon[i % n]
-        if min(p1y, p2y) < y <= max(p1y, p2y) and x <= max(p1x, p2x):
-            if p1y != p2y:
-                xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-            if p1x == p2x or x <= xinters:
-                inside = not inside
-        p1x, p1y = p2x, p2y
-    return inside
+    return fastgeom.point_in_polygon(pt[0], pt[1], polygon)
 
 
 @dataclass
 class PolygonData:
     points: List[Tuple[float, float]] = field(default_factory=list)
-    area_px: float = 0.0
-    perimeter_px: float = 0.0
     metadata: dict = field(default_factory=dict)
+    _dirty: bool = field(default=True, repr=False, compare=False)
+    _area_px: float = field(default=0.0, repr=False, compare=False)
+    _perimeter_px: float = field(default=0.0, repr=False, compare=False)
+    _bbox: Tuple[float, float, float, float] = field(
+        default=(0.0, 0.0, 0.0, 0.0), repr=False, compare=False)
+    _pts_np: object = field(default=None, repr=False, compare=False)
+    _centroid: object = field(default=None, repr=False, compare=False)
+    _canvas_coords: object = field(default=None, repr=False, compare=False)
+    _canvas_zoom: object = field(default=None, repr=False, compare=False)
+    _display_pts: object = field(default=None, repr=False, compare=False)
+    _display_coords: object = field(default=None, repr=False, compare=False)
+    _display_zoom: object = field(default=None, repr=False, compare=False)
+    _display_coords_zoom: object = field(default=None, repr=False, compare=False)
+
+    # Polygons denser than this render a Douglas-Peucker-simplified
+    # outline; the raw points always remain the source for metrics,
+    # export, and hit testing.
+    DISPLAY_MAX_N = 200
+
+    def canvas_coords(self, zoom: float) -> List[float]:
+        """Flattened canvas-space coordinates at ``zoom``, cached per zoom.
+
+        For a static scene this turns redraw's per-vertex multiply loop
+        into a cached-list lookup; the dirty flag doubles as the edit
+        invalidation signal.
+        """
+        if (self._canvas_coords is not None and self._canvas_zoom == zoom
+                and not self._dirty):
+            return self._canvas_coords
+        if np is not None:
+            coords = (self.as_array().ravel() * zoom).tolist()
+        else:
+            coords = []
+            for x, y in self.points:
+                coords.append(x * zoom)
+                coords.append(y * zoom)
+        self._canvas_coords = coords
+        self._canvas_zoom = zoom
+        return coords
+
+    def display_coords(self, zoom: float) -> List[float]:
+        """Canvas coordinates for rendering, simplified when very dense.
+
+        Below ``DISPLAY_MAX_N`` vertices this is exactly ``canvas_coords``.
+        Above it, a simplified copy (epsilon of half an image pixel at the
+        current zoom) caps Tk's per-item vertex count. The simplified
+        vertex list is reused until the polygon is edited or the zoom
+        drifts by more than 25% (when the epsilon would change enough to
+        matter); the scaling to canvas space is always exact for the
+        requested zoom.
+        """
+        if len(self.points) <= self.DISPLAY_MAX_N:
+            return self.canvas_coords(zoom)
+        if (self._display_pts is None or self._dirty
+                or self._display_zoom is None
+                or abs(zoom - self._display_zoom) > 0.25 * self._display_zoom):
+            eps = 0.5 / zoom if zoom > 0 else 0.5
+            simple = fastgeom.simplify_polyline(self.as_array() if np is not None
+                                                else self.points,
+                                                eps, self.DISPLAY_MAX_N)
+            self._display_pts = simple
+            self._display_zoom = zoom
+            self._display_coords = None
+        if (self._display_coords is not None
+                and self._display_coords_zoom == zoom):
+            return self._display_coords
+        coords: List[float] = []
+        for x, y in self._display_pts:
+            coords.append(x * zoom)
+            coords.append(y * zoom)
+        self._display_coords = coords
+        self._display_coords_zoom = zoom
+        return coords
+
+    def as_array(self):
+        """Return the vertices as a cached ``(n, 2)`` float64 array."""
+        if np is None:
+            return self.points
+        if self._dirty or self._pts_np is None:
+            self._refresh()
+        return self._pts_np
 
     def compute_metrics(self) -> None:
-        """Recompute area and perimeter in pixel units."""
-        self.area_px = shoelace_area(self.points)
-        self.perimeter_px = polygon_perimeter(self.points)
+        """Mark cached metrics stale; they are recomputed on next access.
+
+        During a drag this fires on every motion event, so the O(n)
+        area/perimeter/bbox pass is deferred until something actually
+        reads the values (info label, export, hit testing).
+        """
+        self._dirty = True
+
+    @property
+    def area_px(self) -> float:
+        if self._dirty:
+            self._refresh()
+        return self._area_px
+
+    @property
+    def perimeter_px(self) -> float:
+        if self._dirty:
+            self._refresh()
+        return self._perimeter_px
+
+    @property
+    def bbox(self) -> Tuple[float, float, float, float]:
+        if self._dirty:
+            self._refresh()
+        return self._bbox
+
+    def centroid_px(self) -> "Tuple[float, float] | None":
+        """Cached area-weighted centroid; recomputed only after an edit."""
+        if self._dirty:
+            self._refresh()
+        if self._centroid is None and self.points:
+            self._centroid = polygon_centroid(
+                self._pts_np if self._pts_np is not None else self.points)
+        return self._centroid
+
+    def _refresh(self) -> None:
+        """Recompute area, perimeter, and bbox in pixel units."""
+        # _refresh runs exactly when the points changed, so any coordinate
+        # lists derived from them are stale regardless of zoom.
+        self._canvas_coords = None
+        self._display_pts = None
+        self._display_coords = None
+        self._centroid = None
+        if np is not None:
+            self._pts_np = np.asarray(self.points, dtype=np.float64).reshape(-1, 2)
+        pts = self._pts_np if self._pts_np is not None else self.points
+        if fastgeom.HAS_NUMBA and len(self.points) >= 3:
+            # Fused kernel: one pass over the vertices yields both metrics.
+            self._area_px, self._perimeter_px = fastgeom.polygon_metrics(pts)
+        else:
+            self._area_px = shoelace_area(pts)
+            self._perimeter_px = polygon_perimeter(pts)
+        if len(self.points) == 0:
+            self._bbox = (0.0, 0.0, 0.0, 0.0)
+        elif np is not None:
+            mins = self._pts_np.min(axis=0)
+            maxs = self._pts_np.max(axis=0)
+            self._bbox = (float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1]))
+        else:
+            xs = [p[0] for p in self.points]
+            ys = [p[1] for p in self.points]
+            self._bbox = (min(xs), min(ys), max(xs), max(ys))
+        self._dirty = False
+
 
-
@@ -3,6 +3,14 @@ from __future__ import annotations
 import math
 from typing import TYPE_CHECKING, Optional, Tuple, List
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+# Vertex hit radius for drag start, in canvas pixels.
+HIT_RADIUS = 8
+
 if TYPE_CHECKING:
     try:
         from ...gui_client import MeasureAppGUI  # type: ignore
@@ -17,23 +25,44 @@ def on_drag_start(app: "MeasureAppGUI", event) -> None:
         return
     x = app.canvas.canvasx(event.x)
     y = app.canvas.canvasy(event.y)
-    # Find a vertex under cursor across all polygons
+    # Find a vertex under cursor across all polygons. Each polygon's
+    # cached bounding box (inflated by the hit radius) rejects most
+    # candidates before any per-vertex work; survivors get a single
+    # vectorized Chebyshev-distance test instead of a Python loop.
+    zoom = app.zoom_level
+    r = HIT_RADIUS
     hit_poly_idx = None
     hit_vertex_idx = None
     for pidx, poly_try in enumerate(app.polygons):
-        for i, (px, py) in enumerate(poly_try.points):
-            canvas_x = px * app.zoom_level
-            canvas_y = py * app.zoom_level
-            if abs(x - canvas_x) <= 8 and abs(y - canvas_y) <= 8:
+        bx0, by0, bx1, by1 = poly_try.bbox
+        if (x < bx0 * zoom - r or x > bx1 * zoom + r
+                or y < by0 * zoom - r or y > by1 * zoom + r):
+            continue
+        if np is not None:
+            pts = poly_try.as_array()
+            if len(pts) == 0:
+                continue
+            d = np.abs(pts * zoom - (x, y)).max(axis=1)
+            i = int(d.argmin())
+            if d[i] <= r:
                 hit_poly_idx = pidx
                 hit_vertex_idx = i
-                break
+        else:
+            for i, (px, py) in enumerate(poly_try.points):
+                if abs(x - px * zoom) <= r and abs(y - py * zoom) <= r:
+                    hit_poly_idx = pidx
+                    hit_vertex_idx = i
+                    break
         if hit_poly_idx is not None:
             break
     if hit_poly_idx is None or hit_vertex_idx is None:
         return
-    # Select polygon and start drag on that vertex
-    app.selected_polygon = hit_poly_idx
+    # Select polygon and start drag on that vertex; set_selection updates
+    # outlines and markers in place so no full redraw is needed here.
+    if hasattr(app, 'set_selection'):
+        app.set_selection(hit_poly_idx)
+    else:
+        app.selected_polygon = hit_poly_idx
     poly = app.polygons[app.selected_polygon]
     pts = poly.points
     i = hit_vertex_idx
@@ -63,6 +92,46 @@ def on_drag_start(app: "MeasureAppGUI", event) -> None:
         pass
 
 
+def _move_vertex_items(app: "MeasureAppGUI", poly, idx: int,
+                       new_x: float, new_y: float) -> bool:
+    """Reposition only the dragged vertex in the polygon's canvas items.
+
+    Returns False when the fast path cannot apply (items missing, the
+    polygon renders through a simplified display copy whose vertex
+    indices no longer line up, or its selection markers render as one
+    batched image with no per-vertex item to move); the caller falls
+    back to a full redraw.
+    """
+    n = len(poly.points)
+    if n > getattr(poly, 'DISPLAY_MAX_N', 200):
+        return False
+    if n > getattr(app, '_MARKER_BATCH_THRESHOLD', 50):
+        return False
+    fill_item = getattr(poly, '_fill_item', None)
+    outline_item = getattr(poly, '_outline_item', None)
+    if fill_item is None or outline_item is None:
+        return False
+    canvas = app.canvas
+    zoom = app.zoom_level
+    cx = new_x * zoom
+    cy = new_y * zoom
+    try:
+        coords = canvas.coords(fill_item)
+        if len(coords) < 2 * idx + 2:
+            return False
+        coords[2 * idx] = cx
+        coords[2 * idx + 1] = cy
+        canvas.coords(fill_item, *coords)
+        canvas.coords(outline_item, *coords)
+        # Keep the vertex's pooled selection marker under the cursor
+        pool = getattr(app, '_marker_pool', [])
+        if idx < len(pool):
+            canvas.coords(pool[idx], cx - 6, cy - 6, cx + 6, cy + 6)
+    except Exception:
+        return False
+    return True
+
+
 def on_drag_move(app: "MeasureAppGUI", event) -> None:
     if not app.dragging or app.drag_point_index is None:
         return
@@ -71,8 +140,9 @@ def on_drag_move(app: "MeasureAppGUI", event) -> None:
     x = app.canvas.canvasx(event.x)
     y = app.canvas.canvasy(event.y)
     poly = app.polygons[app.selected_polygon]
-    new_x = x / app.zoom_level
-    new_y = y / app.zoom_level
+    inv_zoom = app._inv_zoom
+    new_x = x * inv_zoom
+    new_y = y * inv_zoom
 
     # Snap-to-line behavior when nearing 180 degrees
     idx = app.drag_point_index
@@ -112,7 +182,12 @@ def on_drag_move(app: "MeasureAppGUI", event) -> None:
 
     poly.points[idx] = (new_x, new_y)
     poly.compute_metrics()
-    app.redraw()
+    # Per-pixel updates touch only the dragged vertex's items; metrics
+    # stay lazily dirty and the full repaint waits until on_drag_end.
+    if not _move_vertex_items(app, poly, idx, new_x, new_y):
+        # Fallback repaint is coalesced to one redraw per idle tick so a
+        # fast drag over a dense polygon cannot queue a repaint per pixel.
+        app._schedule_redraw()
     # Draw elastic connectors: prev->current and current->next and spring to original
     try:
         # Clean previous artifacts
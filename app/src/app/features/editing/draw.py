@@ -112,8 +112,8 @@ def draw_on_canvas_click(app: "MeasureAppGUI", event) -> bool:
         return False
     canvas_x = app.canvas.canvasx(event.x)
     canvas_y = app.canvas.canvasy(event.y)
-    norm_x = canvas_x / app.zoom_level
-    norm_y = canvas_y / app.zoom_level
+    norm_x = canvas_x * app._inv_zoom
+    norm_y = canvas_y * app._inv_zoom
 
     closing = False
     if app.current_polygon:
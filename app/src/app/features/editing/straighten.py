@@ -1,113 +1,163 @@
-from __future__ import annotations
-
-import math
-from typing import TYPE_CHECKING, List, Tuple
-
-try:
-    from tkinter import messagebox
-except Exception:  # pragma: no cover
-    messagebox = None  # type: ignore
-
-if TYPE_CHECKING:
-    try:
-        from ...gui_client import MeasureAppGUI  # type: ignore
-    except Exception:
-        from gui_client import MeasureAppGUI  # type: ignore
-
-
-def _rectangle_map(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
-    """Project polygon vertices onto the minimal axis-aligned rectangle bounding them."""
-    if len(points) < 4:
-        return points[:]
-
-    closed = points[0] == points[-1]
-    pts = points[:-1] if closed else points[:]
-    if len(pts) < 4:
-        return points[:]
-
-    xs = [p[0] for p in pts]
-    ys = [p[1] for p in pts]
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
-    width = max_x - min_x
-    height = max_y - min_y
-    if width < 1e-9 or height < 1e-9:
-        return points[:]
-
-    perim_rect = 2.0 * (width + height)
-
-    # cumulative lengths along original polygon perimeter
-    seg_lengths = [0.0]
-    total = 0.0
-    for idx in range(len(pts)):
-        x1, y1 = pts[idx]
-        x2, y2 = pts[(idx + 1) % len(pts)]
-        total += math.hypot(x2 - x1, y2 - y1)
-        seg_lengths.append(total)
-    if total < 1e-9:
-        return points[:]
-
-    mapped: List[Tuple[float, float]] = []
-    for idx in range(len(pts)):
-        frac = seg_lengths[idx] / total
-        dist = frac * perim_rect
-        dist_mod = dist % perim_rect
-        if dist_mod <= width:
-            mapped.append((min_x + dist_mod, min_y))
-        elif dist_mod <= width + height:
-            mapped.append((max_x, min_y + (dist_mod - width)))
-        elif dist_mod <= 2 * width + height:
-            mapped.append((max_x - (dist_mod - (width + height)), max_y))
-        else:
-            mapped.append((min_x, max_y - (dist_mod - (2 * width + height))))
-
-    if closed:
-        mapped.append(mapped[0])
-
-    return mapped
-
-
-def _compute_straightened_points(pts: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
-    return _rectangle_map(pts)
-
-
-def straighten_polygon(app: "MeasureAppGUI") -> None:
-    """Straighten the selected polygon into its bounding rectangle."""
-    if app.selected_polygon is None:
-        if messagebox:
-            messagebox.showwarning("Warning", "Select a polygon first.")
-        return
-    poly = app.polygons[app.selected_polygon]
-    if len(poly.points) < 3:
-        if messagebox:
-            messagebox.showwarning("Warning", "Polygon must have at least 3 points.")
-        return
-    proposed = _compute_straightened_points(poly.points)
-    if proposed == poly.points:
-        return
-    app._straighten_backup = poly.points.copy()
-    poly.points = proposed
-    poly.compute_metrics()
-    try:
-        if hasattr(app, "update_info_label"):
-            app.update_info_label()
-    except Exception:
-        pass
-    app.redraw()
-
-
-def undo_straighten(app: "MeasureAppGUI") -> None:
-    if app.selected_polygon is None or app._straighten_backup is None:
-        if messagebox:
-            messagebox.showwarning("Warning", "No straighten operation to undo.")
-        return
-    poly = app.polygons[app.selected_polygon]
-    poly.points = app._straighten_backup
-    poly.compute_metrics()
-    app._straighten_backup = None
-    try:
-        if hasattr(app, "update_info_label"):
-            app.update_info_label()
-    except Exception:
-        pass
-    app.redraw()
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, List, Tuple
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+try:
+    from tkinter import messagebox
+except Exception:  # pragma: no cover
+    messagebox = None  # type: ignore
+
+if TYPE_CHECKING:
+    try:
+        from ...gui_client import MeasureAppGUI  # type: ignore
+    except Exception:
+        from gui_client import MeasureAppGUI  # type: ignore
+
+
+def _rectangle_map(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Project polygon vertices onto the minimal axis-aligned rectangle bounding them."""
+    if len(points) < 4:
+        return points[:]
+
+    closed = points[0] == points[-1]
+    pts = points[:-1] if closed else points[:]
+    if len(pts) < 4:
+        return points[:]
+
+    xs = [p[0] for p in pts]
+    ys = [p[1] for p in pts]
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
+    width = max_x - min_x
+    height = max_y - min_y
+    if width < 1e-9 or height < 1e-9:
+        return points[:]
+
+    perim_rect = 2.0 * (width + height)
+
+    if np is not None:
+        # Vectorized arc-length mapping: cumulative perimeter distances and
+        # the projection onto the rectangle sides in one NumPy pass.
+        arr = np.asarray(pts, dtype=np.float64)
+        seg = np.hypot(
+            np.diff(arr[:, 0], append=arr[0, 0]),
+            np.diff(arr[:, 1], append=arr[0, 1]),
+        )
+        total = float(seg.sum())
+        if total < 1e-9:
+            return points[:]
+        cum = np.concatenate(([0.0], np.cumsum(seg[:-1])))
+        dist = (cum * (perim_rect / total)) % perim_rect
+        xs = np.empty(len(pts))
+        ys = np.empty(len(pts))
+        side0 = dist <= width
+        side1 = ~side0 & (dist <= width + height)
+        side2 = ~side0 & ~side1 & (dist <= 2 * width + height)
+        side3 = ~(side0 | side1 | side2)
+        xs[side0] = min_x + dist[side0]
+        ys[side0] = min_y
+        xs[side1] = max_x
+        ys[side1] = min_y + (dist[side1] - width)
+        xs[side2] = max_x - (dist[side2] - (width + height))
+        ys[side2] = max_y
+        xs[side3] = min_x
+        ys[side3] = max_y - (dist[side3] - (2 * width + height))
+        mapped = list(zip(xs.tolist(), ys.tolist()))
+        if closed:
+            mapped.append(mapped[0])
+        return mapped
+
+    # cumulative lengths along original polygon perimeter; walk successive
+    # pairs directly instead of computing a modulo per step
+    seg_lengths = [0.0]
+    total = 0.0
+    x1, y1 = pts[0]
+    for x2, y2 in pts[1:]:
+        total += math.hypot(x2 - x1, y2 - y1)
+        seg_lengths.append(total)
+        x1, y1 = x2, y2
+    x2, y2 = pts[0]
+    total += math.hypot(x2 - x1, y2 - y1)
+    seg_lengths.append(total)
+    if total < 1e-9:
+        return points[:]
+
+    # One division up front; the per-vertex walk is then multiply-only.
+    dist_scale = perim_rect / total
+    n = len(pts)
+    mapped: List[Tuple[float, float]] = [(0.0, 0.0)] * n
+    for idx in range(n):
+        dist_mod = (seg_lengths[idx] * dist_scale) % perim_rect
+        if dist_mod <= width:
+            mapped[idx] = (min_x + dist_mod, min_y)
+        elif dist_mod <= width + height:
+            mapped[idx] = (max_x, min_y + (dist_mod - width))
+        elif dist_mod <= 2 * width + height:
+            mapped[idx] = (max_x - (dist_mod - (width + height)), max_y)
+        else:
+            mapped[idx] = (min_x, max_y - (dist_mod - (2 * width + height)))
+
+    if closed:
+        mapped.append(mapped[0])
+
+    return mapped
+
+
+def _compute_straightened_points(pts: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    return _rectangle_map(pts)
+
+
+def straighten_polygon(app: "MeasureAppGUI") -> None:
+    """Straighten the selected polygon into its bounding rectangle."""
+    if app.selected_polygon is None:
+        if messagebox:
+            messagebox.showwarning("Warning", "Select a polygon first.")
+        return
+    poly = app.polygons[app.selected_polygon]
+    if len(poly.points) < 3:
+        if messagebox:
+            messagebox.showwarning("Warning", "Polygon must have at least 3 points.")
+        return
+    # Cheap memo: straightening the same geometry twice is a no-op, so
+    # skip the recompute entirely when the points have not changed.
+    key = hash(tuple(poly.points))
+    if getattr(poly, '_last_straighten_key', None) == key:
+        return
+    proposed = _compute_straightened_points(poly.points)
+    if proposed == poly.points:
+        poly._last_straighten_key = key
+        return
+    app._straighten_backup = poly.points.copy()
+    poly.points = proposed
+    poly._last_straighten_key = hash(tuple(proposed))
+    poly.compute_metrics()
+    try:
+        if hasattr(app, "update_info_label"):
+            app.update_info_label()
+    except Exception:
+        pass
+    app._schedule_redraw()
+
+
+def undo_straighten(app: "MeasureAppGUI") -> None:
+    if app.selected_polygon is None or app._straighten_backup is None:
+        if messagebox:
+            messagebox.showwarning("Warning", "No straighten operation to undo.")
+        return
+    poly = app.polygons[app.selected_polygon]
+    poly.points = app._straighten_backup
+    poly._last_straighten_key = None
+    poly.compute_metrics()
+    app._straighten_backup = None
+    try:
+        if hasattr(app, "update_info_label"):
+            app.update_info_label()
+    except Exception:
+        pass
+    app._schedule_redraw()
@@ -1,7 +1,9 @@
-﻿from __future__ import annotations
+from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .zoom import schedule_viewport_refresh
+
 if TYPE_CHECKING:
     from .gui_client import MeasureAppGUI
 
@@ -9,13 +11,21 @@ if TYPE_CHECKING:
 def pan_canvas(app: "MeasureAppGUI", dx: int, dy: int) -> None:
     app.canvas.xview_scroll(int(dx), 'units')
     app.canvas.yview_scroll(int(dy), 'units')
+    schedule_viewport_refresh(app)
 
 
 def on_pan_start(app: "MeasureAppGUI", event) -> None:
     app.canvas.scan_mark(event.x, event.y)
+    # While panning, scan_dragto translates the canvas origin in O(1);
+    # the flag lets redraw schedulers stay out of the way until release.
+    app._panning = True
 
 
 def on_pan_move(app: "MeasureAppGUI", event) -> None:
     app.canvas.scan_dragto(event.x, event.y, gain=1)
+    schedule_viewport_refresh(app)
+
 
-
+def on_pan_end(app: "MeasureAppGUI", event) -> None:
+    app._panning = False
+    schedule_viewport_refresh(app)
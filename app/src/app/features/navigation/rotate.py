@@ -1,10 +1,17 @@
 ﻿from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 
 from PIL import Image
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+from .zoom import resize_for_zoom, rotated_base, update_photo
+
 if TYPE_CHECKING:
     from .gui_client import MeasureAppGUI
 
@@ -26,51 +33,93 @@ def rotate_right(app: "MeasureAppGUI") -> None:
 def apply_rotation(app: "MeasureAppGUI") -> None:
     if app.image is None:
         return
-    img = app.image.rotate(-app.image_rotation, expand=True)
+    img = rotated_base(app)
     if app.zoom_level != 1.0:
         new_size = (int(img.width * app.zoom_level), int(img.height * app.zoom_level))
         try:
             resample = Image.Resampling.LANCZOS
         except AttributeError:
             resample = Image.LANCZOS
-        img = img.resize(new_size, resample)
-    from PIL import ImageTk
-
-    app.photo = ImageTk.PhotoImage(img)
+        img = resize_for_zoom(app, img, new_size, resample)
+    update_photo(app, img)
     app.display_image = img
+    app._display_size = img.size
+    app._photo_offset = (0, 0)
     app.canvas.config(scrollregion=(0, 0, img.width, img.height))
 
     if app.image_rotation != 0 and app.image is not None:
         w, h = app.image.size
-        temp_rotated = app.image.rotate(-app.image_rotation, expand=True)
-        new_w, new_h = temp_rotated.size
+        new_w, new_h = rotated_base(app).size
         offset_x = (new_w - w) / 2
         offset_y = (new_h - h) / 2
 
-        def rotate_point(px: float, py: float, width: float, height: float, angle: int) -> Tuple[float, float]:
-            angle_rad = math.radians(angle)
-            cx, cy = width / 2, height / 2
-            dx, dy = px - cx, py - cy
-            rx = dx * math.cos(angle_rad) - dy * math.sin(angle_rad)
-            ry = dx * math.sin(angle_rad) + dy * math.cos(angle_rad)
-            return rx + cx, ry + cy
-
-        for poly in app.polygons:
-            transformed = [rotate_point(x, y, w, h, app.image_rotation) for (x, y) in poly.points]
-            transformed = [(x + offset_x, y + offset_y) for (x, y) in transformed]
-            poly.points = transformed
+        # Hoist the trig out of the per-vertex work: one sin/cos pair for
+        # the whole transform instead of two per point. The UI only ever
+        # rotates in 90-degree steps, so use the exact integer
+        # coefficients rather than cos/sin of the radian value (which
+        # leaves ~1e-16 residue and drifts points over repeated turns).
+        quarter = {0: (1.0, 0.0), 90: (0.0, 1.0),
+                   180: (-1.0, 0.0), 270: (0.0, -1.0)}
+        if app.image_rotation in quarter:
+            c, s = quarter[app.image_rotation]
+        else:
+            angle_rad = math.radians(app.image_rotation)
+            c = math.cos(angle_rad)
+            s = math.sin(angle_rad)
+        cx, cy = w / 2, h / 2
+
+        has_artifact = bool(app.scale_artifact and 'points' in app.scale_artifact)
+
+        if np is not None:
+            # One matmul over every point in the scene: all polygons plus
+            # the in-progress polygon, scale points, and scale artifact
+            # are packed into a single (M, 2) array and sliced back out.
+            rot_t = np.array([[c, s], [-s, c]])  # transpose of the rotation matrix
+            center = np.array([cx, cy])
+            shift = center + np.array([offset_x, offset_y])
+            groups: List[List[Tuple[float, float]]] = [poly.points for poly in app.polygons]
+            groups.append(app.current_polygon)
+            groups.append(app.scale_points)
+            groups.append(app.scale_artifact['points'] if has_artifact else [])
+            flat = [p for pts in groups for p in pts]
+            out: List[List[float]] = []
+            if flat:
+                arr = np.asarray(flat, dtype=np.float64).reshape(-1, 2)
+                out = ((arr - center) @ rot_t + shift).tolist()
+            rotated = []
+            pos = 0
+            for pts in groups:
+                end = pos + len(pts)
+                rotated.append([tuple(p) for p in out[pos:end]])
+                pos = end
+        else:
+
+            def rotate_points(pts: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+                out = []
+                for x, y in pts:
+                    dx, dy = x - cx, y - cy
+                    out.append((dx * c - dy * s + cx + offset_x,
+                                dx * s + dy * c + cy + offset_y))
+                return out
+
+            rotated = [rotate_points(poly.points) for poly in app.polygons]
+            rotated.append(rotate_points(app.current_polygon))
+            rotated.append(rotate_points(app.scale_points))
+            rotated.append(rotate_points(app.scale_artifact['points'])
+                           if has_artifact else [])
+
+        for poly, pts in zip(app.polygons, rotated):
+            poly.points = pts
             poly.compute_metrics()
 
-        app.current_polygon = [rotate_point(x, y, w, h, app.image_rotation) for (x, y) in app.current_polygon]
-        app.current_polygon = [(x + offset_x, y + offset_y) for (x, y) in app.current_polygon]
-        app.scale_points = [rotate_point(x, y, w, h, app.image_rotation) for (x, y) in app.scale_points]
-        app.scale_points = [(x + offset_x, y + offset_y) for (x, y) in app.scale_points]
-        if app.scale_artifact and 'points' in app.scale_artifact:
-            pts = app.scale_artifact['points']
-            pts = [rotate_point(x, y, w, h, app.image_rotation) for (x, y) in pts]
-            pts = [(x + offset_x, y + offset_y) for (x, y) in pts]
-            app.scale_artifact['points'] = pts
+        app.scale_points = rotated[-2]
+        app.current_polygon = rotated[-3]
+        if has_artifact:
+            # Preserve the artifact's ndarray form for downstream math.
+            app.scale_artifact['points'] = (
+                np.asarray(rotated[-1], dtype=np.float64)
+                if np is not None else rotated[-1])
 
     app.redraw()
 
-
+
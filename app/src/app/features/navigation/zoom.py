@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,6 +12,191 @@ ZOOM_MIN = 0.01
 ZOOM_MAX = 64.0
 ZOOM_STEP = 1.25
 
+# Recently rendered views (full resizes and viewport tiles) kept for
+# instant zoom-in/zoom-out toggles; bounded so peak memory stays small.
+_VIEW_CACHE_MAX = 8
+
+
+def _get_view_cache(app: "MeasureAppGUI") -> "OrderedDict":
+    cache = getattr(app, '_view_cache', None)
+    if cache is None:
+        cache = app._view_cache = OrderedDict()
+    return cache
+
+
+def _view_cache_get(app: "MeasureAppGUI", key):
+    cache = _get_view_cache(app)
+    img = cache.get(key)
+    if img is not None:
+        cache.move_to_end(key)
+    return img
+
+
+def _view_cache_put(app: "MeasureAppGUI", key, img) -> None:
+    cache = _get_view_cache(app)
+    cache[key] = img
+    while len(cache) > _VIEW_CACHE_MAX:
+        cache.popitem(last=False)
+
+# Pyramid levels below this edge length add nothing worth caching.
+_MIP_MIN_EDGE = 64
+
+try:
+    _BILINEAR = Image.Resampling.BILINEAR
+    _LANCZOS = Image.Resampling.LANCZOS
+except AttributeError:  # pragma: no cover - Pillow < 9.1
+    _BILINEAR = Image.BILINEAR
+    _LANCZOS = Image.LANCZOS
+
+# Extra pixels rasterized around the viewport so small pans and the zoom
+# preview stay inside the current tile.
+TILE_MARGIN = 256
+
+
+def rotated_base(app: "MeasureAppGUI") -> Image.Image:
+    """Return the page rotated to the current angle, cached per angle."""
+    rot = app.image_rotation % 360
+    if rot == 0:
+        return app.image
+    cache = getattr(app, '_rot_cache', None)
+    if cache is None:
+        cache = app._rot_cache = {}
+    img = cache.get(rot)
+    if img is None:
+        # Quarter-turn rotations use the transpose fast paths; the general
+        # affine kernel in rotate() is several times slower for the same
+        # result. rotate(-90) is a clockwise turn, i.e. ROTATE_270.
+        if rot == 90:
+            img = app.image.transpose(Image.ROTATE_270)
+        elif rot == 180:
+            img = app.image.transpose(Image.ROTATE_180)
+        elif rot == 270:
+            img = app.image.transpose(Image.ROTATE_90)
+        else:
+            img = app.image.rotate(-rot, expand=True)
+        cache[rot] = img
+    return img
+
+
+def _mip_pyramid(app: "MeasureAppGUI", img: Image.Image):
+    """Half-resolution pyramid for ``img``, cached per rotation angle."""
+    cache = getattr(app, '_mip_cache', None)
+    if cache is None:
+        cache = app._mip_cache = {}
+    key = app.image_rotation % 360
+    pyramid = cache.get(key)
+    if pyramid is None or pyramid[0] is not img:
+        pyramid = [img]
+        w, h = img.size
+        while w // 2 >= _MIP_MIN_EDGE and h // 2 >= _MIP_MIN_EDGE:
+            w //= 2
+            h //= 2
+            pyramid.append(pyramid[-1].resize((w, h), Image.BILINEAR))
+        cache[key] = pyramid
+    return pyramid
+
+
+def resize_for_zoom(app: "MeasureAppGUI", img: Image.Image, size, resample) -> Image.Image:
+    """Resample ``img`` to ``size`` from the smallest pyramid level covering it.
+
+    Downsampling from the nearest mip level touches at most ~4x the target
+    pixels instead of rerunning LANCZOS over the full-resolution page on
+    every zoom step.
+    """
+    src = img
+    for level in _mip_pyramid(app, img):
+        if level.width >= size[0] and level.height >= size[1]:
+            src = level
+        else:
+            break
+    if src.size == tuple(size):
+        return src
+    key = ('full', app.image_rotation % 360, tuple(size))
+    out = _view_cache_get(app, key)
+    if out is None:
+        out = src.resize(size, resample)
+        _view_cache_put(app, key, out)
+    return out
+
+
+def update_photo(app: "MeasureAppGUI", img: Image.Image) -> None:
+    """Push ``img`` into ``app.photo``, reusing the Tk image when possible.
+
+    PhotoImage.paste rewrites the pixels of the existing Tcl image, which
+    avoids allocating and uploading a fresh server-side image on every
+    zoom/pan; a new PhotoImage is only made when the size changes.
+    """
+    from PIL import ImageTk
+
+    photo = getattr(app, 'photo', None)
+    if photo is not None and getattr(app, '_photo_size', None) == img.size:
+        try:
+            photo.paste(img)
+            return
+        except Exception:
+            pass
+    app.photo = ImageTk.PhotoImage(img)
+    app._photo_size = img.size
+
+
+def render_viewport_tile(app: "MeasureAppGUI", resample=None) -> None:
+    """Rasterize only the visible part of the page (plus a margin).
+
+    At high zoom the full scaled page is zoom^2 times the source pixel
+    count; cropping in source coordinates and resizing just the viewport
+    tile keeps the PhotoImage roughly viewport-sized regardless of zoom.
+    The canvas scrollregion still spans the full scaled page, so polygon
+    coordinates and scrolling are unaffected.
+    """
+    if app.image is None:
+        return
+    canvas = app.canvas
+    img = rotated_base(app)
+    zoom = app.zoom_level
+    full_w = max(1, int(round(img.width * zoom)))
+    full_h = max(1, int(round(img.height * zoom)))
+    canvas.config(scrollregion=(0, 0, full_w, full_h))
+
+    view_w = max(canvas.winfo_width(), 1)
+    view_h = max(canvas.winfo_height(), 1)
+    x0 = max(0, int(canvas.canvasx(0)) - TILE_MARGIN)
+    y0 = max(0, int(canvas.canvasy(0)) - TILE_MARGIN)
+    x1 = min(full_w, x0 + view_w + 2 * TILE_MARGIN)
+    y1 = min(full_h, y0 + view_h + 2 * TILE_MARGIN)
+    if x1 <= x0 or y1 <= y0:
+        return
+
+    if resample is None:
+        resample = _LANCZOS
+    key = ('tile', app.image_rotation % 360, round(zoom, 4), x0, y0, x1, y1, resample)
+    tile = _view_cache_get(app, key)
+    if tile is None:
+        inv = 1.0 / zoom
+        # Fused crop+resize: the box is in source-image coordinates.
+        tile = img.resize(
+            (x1 - x0, y1 - y0), resample,
+            box=(x0 * inv, y0 * inv, x1 * inv, y1 * inv),
+        )
+        _view_cache_put(app, key, tile)
+
+    update_photo(app, tile)
+    app.display_image = tile
+    app._display_size = tile.size
+    app._photo_offset = (x0, y0)
+
+
+def schedule_viewport_refresh(app: "MeasureAppGUI") -> None:
+    """Coalesce re-tiling after pan/resize into a single idle callback."""
+    if getattr(app, '_tile_job', None) is not None:
+        return
+
+    def _run() -> None:
+        app._tile_job = None
+        render_viewport_tile(app)
+        app.redraw()
+
+    app._tile_job = app.root.after_idle(_run)
+
 
 def zoom_in(app: "MeasureAppGUI") -> None:
     set_zoom(app, app.zoom_level * ZOOM_STEP)
@@ -20,10 +206,25 @@ def zoom_out(app: "MeasureAppGUI") -> None:
     set_zoom(app, app.zoom_level / ZOOM_STEP)
 
 
+def _refine_zoom(app: "MeasureAppGUI") -> None:
+    """Idle-quality pass: re-render the current tile with LANCZOS."""
+    app._refine_job = None
+    render_viewport_tile(app)
+
+
 def set_zoom(app: "MeasureAppGUI", zoom: float) -> None:
     if app.image is None:
         return
 
+    # Drop any pending quality pass from a previous zoom step.
+    job = getattr(app, '_refine_job', None)
+    if job is not None:
+        try:
+            app.root.after_cancel(job)
+        except Exception:
+            pass
+        app._refine_job = None
+
     new_zoom = max(ZOOM_MIN, min(zoom, ZOOM_MAX))
     canvas = app.canvas
     canvas.update_idletasks()
@@ -50,24 +251,12 @@ def set_zoom(app: "MeasureAppGUI", zoom: float) -> None:
 
     app.zoom_level = new_zoom
 
-    img = app.image
-    if app.image_rotation != 0:
-        img = img.rotate(-app.image_rotation, expand=True)
+    img = rotated_base(app)
 
     new_width = max(1, int(round(img.width * new_zoom)))
     new_height = max(1, int(round(img.height * new_zoom)))
 
-    try:
-        resample = Image.Resampling.LANCZOS
-    except AttributeError:
-        resample = Image.LANCZOS
-    resized = img.resize((new_width, new_height), resample)
-
-    from PIL import ImageTk
-
-    app.photo = ImageTk.PhotoImage(resized)
-    app.display_image = resized
-    canvas.config(scrollregion=(0, 0, resized.width, resized.height))
+    canvas.config(scrollregion=(0, 0, new_width, new_height))
 
     new_canvas_x = image_x * new_zoom
     new_canvas_y = image_y * new_zoom
@@ -79,16 +268,22 @@ def set_zoom(app: "MeasureAppGUI", zoom: float) -> None:
         target_left = new_canvas_x - view_w / 2
         target_top = new_canvas_y - view_h / 2
 
-    max_left = max(0, resized.width - view_w)
-    max_top = max(0, resized.height - view_h)
+    max_left = max(0, new_width - view_w)
+    max_top = max(0, new_height - view_h)
+
+    left = 0 if new_width <= view_w else max(0, min(target_left, max_left))
+    top = 0 if new_height <= view_h else max(0, min(target_top, max_top))
 
-    left = 0 if resized.width <= view_w else max(0, min(target_left, max_left))
-    top = 0 if resized.height <= view_h else max(0, min(target_top, max_top))
+    if new_width > 0:
+        canvas.xview_moveto(left / new_width)
+    if new_height > 0:
+        canvas.yview_moveto(top / new_height)
 
-    if resized.width > 0:
-        canvas.xview_moveto(left / resized.width)
-    if resized.height > 0:
-        canvas.yview_moveto(top / resized.height)
+    # Rasterize only the tile now visible at the new zoom/scroll position.
+    # BILINEAR keeps the gesture responsive; a LANCZOS pass replaces the
+    # pixels in place once the zoom level has rested for 200 ms.
+    render_viewport_tile(app, _BILINEAR)
+    app._refine_job = app.root.after(200, lambda: _refine_zoom(app))
 
     app.redraw()
 
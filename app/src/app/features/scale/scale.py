@@ -1,9 +1,20 @@
 ﻿from __future__ import annotations
 
 import math
+import re
 from typing import Optional, TYPE_CHECKING
 import datetime
 
+# Accepts plain and scientific-notation decimals; matching up front keeps
+# mis-typed dialog input on the cheap regex path instead of raising and
+# catching ValueError from float().
+_FLOAT_RE = re.compile(r'^\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*$')
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 try:
     import tkinter as tk
     from tkinter import simpledialog, messagebox, ttk
@@ -38,6 +49,62 @@ PERSISTENT_ENDPOINT_RADIUS: int = 8
 PERSISTENT_ENDPOINT_OUTLINE: str = 'black'
 PERSISTENT_ENDPOINT_FILL: str = 'purple'
 
+# Units offered by the scale dialog; built once rather than per open.
+SCALE_UNITS: tuple[str, ...] = ("mm", "cm", "m", "in", "ft", "yd", "km", "mi")
+
+
+if simpledialog is not None:
+    class UnitLengthDialog(simpledialog.Dialog):
+        """Combined unit + length prompt for defining the scale.
+
+        Lives at module scope so the class object and its MRO are built
+        once at import time instead of on every scale definition.
+        """
+
+        def __init__(self, parent, title: str = "Set Unit/Scale"):
+            self.selected_unit: Optional[str] = None
+            self.entered_length: Optional[float] = None
+            super().__init__(parent, title)
+
+        def body(self, master):
+            tk.Label(master, text="Unit:").grid(row=0, column=0, sticky="e", padx=6, pady=6)
+            tk.Label(master, text="Length:").grid(row=1, column=0, sticky="e", padx=6, pady=6)
+
+            self.unit_var = tk.StringVar(value="m")
+            self.unit_combo = ttk.Combobox(master, textvariable=self.unit_var, values=SCALE_UNITS, state="readonly", width=8)
+            self.unit_combo.grid(row=0, column=1, sticky="w", padx=6, pady=6)
+            self.unit_combo.current(2)
+
+            self.len_var = tk.StringVar(value="1.0")
+            self.len_entry = tk.Entry(master, textvariable=self.len_var, width=12)
+            self.len_entry.grid(row=1, column=1, sticky="w", padx=6, pady=6)
+            return self.len_entry
+
+        def validate(self):
+            unit = self.unit_var.get().strip()
+            if not unit:
+                if messagebox:
+                    messagebox.showerror("Set Unit/Scale", "Please choose a unit.")
+                return False
+            length_str = self.len_var.get()
+            if not _FLOAT_RE.match(length_str):
+                if messagebox:
+                    messagebox.showerror("Set Unit/Scale", "Enter a numeric value for the length.")
+                return False
+            length = float(length_str)
+            if length <= 0:
+                if messagebox:
+                    messagebox.showerror("Set Unit/Scale", "Length must be greater than zero.")
+                return False
+            self.selected_unit = unit
+            self.entered_length = length
+            return True
+
+        def apply(self):
+            pass
+else:  # pragma: no cover
+    UnitLengthDialog = None  # type: ignore
+
 
 def set_scale_mode(app: "MeasureAppGUI") -> None:
     if app.image is None:
@@ -56,9 +123,7 @@ def set_scale_mode(app: "MeasureAppGUI") -> None:
     app.scale_mode = True
     app.draw_mode = False
     app.scale_points.clear()
-    if app.scale_marker_id is not None:
-        app.canvas.delete(app.scale_marker_id)
-        app.scale_marker_id = None
+    _hide_scale_marker(app)
     if app.scale_line_id is not None:
         app.canvas.delete(app.scale_line_id)
         app.scale_line_id = None
@@ -70,7 +135,10 @@ def set_scale_mode(app: "MeasureAppGUI") -> None:
             "Set Unit/Scale",
             "Click two points on a known distance.\nA target cursor will appear for precise placement.\nPress Esc at any time to cancel.",
         )
-    app.canvas.bind("<Motion>", lambda e: scale_on_motion(app, e))
+    # No extra <Motion> binding here: the canvas's standing
+    # on_canvas_motion handler already dispatches scale_on_motion (and
+    # draw_on_motion) through the 16 ms coalescer. Rebinding a direct
+    # lambda would bypass that throttle and linger after mode exit.
 
 
 def clear_scale_preview(app: "MeasureAppGUI") -> None:
@@ -79,28 +147,39 @@ def clear_scale_preview(app: "MeasureAppGUI") -> None:
         app.scale_preview_line_id = None
 
 
+def _hide_scale_marker(app: "MeasureAppGUI") -> None:
+    """Hide the first-click marker, keeping the item for later reuse."""
+    if app.scale_marker_id is None:
+        return
+    try:
+        app.canvas.itemconfigure(app.scale_marker_id, state='hidden')
+    except Exception:
+        app.scale_marker_id = None
+
+
 def exit_scale_mode(app: "MeasureAppGUI") -> None:
     app.scale_mode = False
+    # Restore the canonical coalesced handler in case a feature replaced
+    # the <Motion> binding while the mode was active; a direct per-event
+    # lambda left bound here would keep firing on every hover forever.
+    app.canvas.bind("<Motion>", app.on_canvas_motion)
     app.canvas.config(cursor="")
     clear_scale_preview(app)
     app.hide_zoom_preview()
     app.root.unbind("<Escape>")
     app.scale_line_id = None
-    app.scale_marker_id = None
+    _hide_scale_marker(app)
 
 
 def cancel_scale_mode(app: "MeasureAppGUI") -> None:
     if not app.scale_mode:
         return
-    if app.scale_marker_id is not None:
-        app.canvas.delete(app.scale_marker_id)
-        app.scale_marker_id = None
     if app.scale_line_id is not None:
         app.canvas.delete(app.scale_line_id)
         app.scale_line_id = None
     app.scale_points.clear()
     exit_scale_mode(app)
-    app.redraw()
+    app._schedule_redraw()
 
 
 def _prompt_scale_unit(app: "MeasureAppGUI") -> Optional[tuple[str, float]]:
@@ -108,50 +187,6 @@ def _prompt_scale_unit(app: "MeasureAppGUI") -> Optional[tuple[str, float]]:
     if simpledialog is None or tk is None:
         return ("units", 1.0)
 
-    class UnitLengthDialog(simpledialog.Dialog):
-        def __init__(self, parent, title: str = "Set Unit/Scale"):
-            self.selected_unit: Optional[str] = None
-            self.entered_length: Optional[float] = None
-            super().__init__(parent, title)
-
-        def body(self, master):
-            tk.Label(master, text="Unit:").grid(row=0, column=0, sticky="e", padx=6, pady=6)
-            tk.Label(master, text="Length:").grid(row=1, column=0, sticky="e", padx=6, pady=6)
-
-            units = ["mm", "cm", "m", "in", "ft", "yd", "km", "mi"]
-            self.unit_var = tk.StringVar(value="m")
-            self.unit_combo = ttk.Combobox(master, textvariable=self.unit_var, values=units, state="readonly", width=8)
-            self.unit_combo.grid(row=0, column=1, sticky="w", padx=6, pady=6)
-            self.unit_combo.current(2)
-
-            self.len_var = tk.StringVar(value="1.0")
-            self.len_entry = tk.Entry(master, textvariable=self.len_var, width=12)
-            self.len_entry.grid(row=1, column=1, sticky="w", padx=6, pady=6)
-            return self.len_entry
-
-        def validate(self):
-            unit = self.unit_var.get().strip()
-            if not unit:
-                if messagebox:
-                    messagebox.showerror("Set Unit/Scale", "Please choose a unit.")
-                return False
-            try:
-                length = float(self.len_var.get())
-            except ValueError:
-                if messagebox:
-                    messagebox.showerror("Set Unit/Scale", "Enter a numeric value for the length.")
-                return False
-            if length <= 0:
-                if messagebox:
-                    messagebox.showerror("Set Unit/Scale", "Length must be greater than zero.")
-                return False
-            self.selected_unit = unit
-            self.entered_length = length
-            return True
-
-        def apply(self):
-            pass
-
     dlg = UnitLengthDialog(app.root)
     if dlg.selected_unit is None or dlg.entered_length is None:
         return None
@@ -166,12 +201,11 @@ def _prompt_scale_length(app: "MeasureAppGUI", unit: str) -> Optional[float]:
         real_len_str = simpledialog.askstring("Set Unit/Scale", prompt)
         if real_len_str is None:
             return None
-        try:
-            real_len = float(real_len_str)
-        except (TypeError, ValueError):
+        if not _FLOAT_RE.match(real_len_str):
             if messagebox:
                 messagebox.showerror("Set Unit/Scale", "Enter a numeric value for the length.")
             continue
+        real_len = float(real_len_str)
         if real_len <= 0:
             if messagebox:
                 messagebox.showerror("Set Unit/Scale", "Length must be greater than zero.")
@@ -208,54 +242,70 @@ def scale_on_canvas_click(app: "MeasureAppGUI", event) -> bool:
         return False
     x = app.canvas.canvasx(event.x)
     y = app.canvas.canvasy(event.y)
-    app.scale_points.append((x / app.zoom_level, y / app.zoom_level))
+    app.scale_points.append((x * app._inv_zoom, y * app._inv_zoom))
     if len(app.scale_points) == 1:
-        if app.scale_marker_id is not None:
-            app.canvas.delete(app.scale_marker_id)
         px, py = app.scale_points[0]
         px *= app.zoom_level
         py *= app.zoom_level
-        app.scale_marker_id = app.canvas.create_oval(
-            px - MARKER_RADIUS, py - MARKER_RADIUS, px + MARKER_RADIUS, py + MARKER_RADIUS,
-            fill=MARKER_FILL, outline=MARKER_OUTLINE, width=MARKER_OUTLINE_WIDTH
-        )
-        app.redraw()
+        # Reuse the marker item across scale definitions: move and show it
+        # rather than deleting and reallocating.
+        marker = app.scale_marker_id
+        if marker is not None:
+            try:
+                app.canvas.coords(marker, px - MARKER_RADIUS, py - MARKER_RADIUS,
+                                  px + MARKER_RADIUS, py + MARKER_RADIUS)
+                app.canvas.itemconfigure(marker, state='normal')
+            except Exception:
+                marker = None
+        if marker is None:
+            app.scale_marker_id = app.canvas.create_oval(
+                px - MARKER_RADIUS, py - MARKER_RADIUS, px + MARKER_RADIUS, py + MARKER_RADIUS,
+                fill=MARKER_FILL, outline=MARKER_OUTLINE, width=MARKER_OUTLINE_WIDTH
+            )
+        # The marker item above is the only visible change; a full
+        # redraw here would re-render the scene just to show one oval.
         return True
     if len(app.scale_points) == 2:
         px1, py1 = app.scale_points[0]
         px2, py2 = app.scale_points[1]
         px1_canvas, py1_canvas = px1 * app.zoom_level, py1 * app.zoom_level
         px2_canvas, py2_canvas = px2 * app.zoom_level, py2 * app.zoom_level
-        if app.scale_marker_id is not None:
-            app.canvas.delete(app.scale_marker_id)
-            app.scale_marker_id = None
+        _hide_scale_marker(app)
         clear_scale_preview(app)
         dx = px2 - px1
         dy = py2 - py1
-        pixel_dist = math.hypot(dx, dy)
-        if pixel_dist == 0:
+        # Squared distance covers the distinct-points test; take the root
+        # only for the real distance on the valid path.
+        dist_sq = dx * dx + dy * dy
+        if dist_sq < 1e-12:
             if messagebox:
                 messagebox.showerror("Set Unit/Scale", "Select two distinct points to set the scale.")
             app.scale_points.clear()
-            app.redraw()
+            app._schedule_redraw()
             return True
+        pixel_dist = math.sqrt(dist_sq)
+        # Tagged 'overlay' so the incremental redraw, which renders the
+        # persistent artifact from scale_artifact, replaces these copies.
         app.scale_line_id = app.canvas.create_line(
             px1_canvas, py1_canvas, px2_canvas, py2_canvas,
-            fill=PERSISTENT_LINE_COLOR, width=PERSISTENT_LINE_WIDTH, dash=PERSISTENT_LINE_DASH
+            fill=PERSISTENT_LINE_COLOR, width=PERSISTENT_LINE_WIDTH, dash=PERSISTENT_LINE_DASH,
+            tags=('overlay',)
         )
         app.canvas.create_oval(
             px1_canvas - PERSISTENT_ENDPOINT_RADIUS,
             py1_canvas - PERSISTENT_ENDPOINT_RADIUS,
             px1_canvas + PERSISTENT_ENDPOINT_RADIUS,
             py1_canvas + PERSISTENT_ENDPOINT_RADIUS,
-            fill=PERSISTENT_ENDPOINT_FILL, outline=PERSISTENT_ENDPOINT_OUTLINE, width=2
+            fill=PERSISTENT_ENDPOINT_FILL, outline=PERSISTENT_ENDPOINT_OUTLINE, width=2,
+            tags=('overlay',)
         )
         app.canvas.create_oval(
             px2_canvas - PERSISTENT_ENDPOINT_RADIUS,
             py2_canvas - PERSISTENT_ENDPOINT_RADIUS,
             px2_canvas + PERSISTENT_ENDPOINT_RADIUS,
             py2_canvas + PERSISTENT_ENDPOINT_RADIUS,
-            fill=PERSISTENT_ENDPOINT_FILL, outline=PERSISTENT_ENDPOINT_OUTLINE, width=2
+            fill=PERSISTENT_ENDPOINT_FILL, outline=PERSISTENT_ENDPOINT_OUTLINE, width=2,
+            tags=('overlay',)
         )
         unit_len = _prompt_scale_unit(app)
         if unit_len is None:
@@ -278,7 +328,11 @@ def scale_on_canvas_click(app: "MeasureAppGUI", event) -> bool:
         app.scale_unit = unit
         app.scale_label.config(text=f"Scale: {app.scale_factor:.4f} {app.scale_unit}/pixel")
         app.scale_artifact = {
-            'points': app.scale_points.copy(),
+            # Stored as a (2, 2) float array so downstream math (redraw
+            # scaling, rotation) consumes it without re-parsing tuples;
+            # serialize with .tolist() if it ever needs to leave process.
+            'points': (np.array(app.scale_points, dtype=np.float64)
+                       if np is not None else app.scale_points.copy()),
             'real_length': real_len,
             'pixel_length': pixel_dist,
             'unit': app.scale_unit,
@@ -293,7 +347,7 @@ def scale_on_canvas_click(app: "MeasureAppGUI", event) -> bool:
         app.scale_points.clear()
         exit_scale_mode(app)
         app.update_info_label()
-        app.redraw()
+        app._schedule_redraw()
         return True
     return False
-
+
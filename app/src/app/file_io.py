@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import os
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 try:
@@ -11,6 +13,7 @@ except Exception:  # pragma: no cover
     filedialog = None  # type: ignore
     messagebox = None  # type: ignore
 
+import numpy as np
 import pymupdf as fitz
 from PIL import Image
 
@@ -18,21 +21,35 @@ if TYPE_CHECKING:
     from .gui_client import MeasureAppGUI
 
 
-def _pdf_page_to_image(pdf_path: str, page_number: int = 0) -> Image.Image:
-    """Load the specified page of a PDF and convert it to a PIL Image."""
-    with open(pdf_path, 'rb') as f:
-        doc = fitz.open(stream=f.read(), filetype='pdf')
+def open_pdf(pdf_path: str) -> "fitz.Document":
+    """Open a PDF document for repeated page access.
+
+    Opening by path lets MuPDF stream from disk; keeping the returned
+    document alive avoids re-parsing xref/font/image tables when other
+    pages of the same drawing set are rendered later.
+    """
+    return fitz.open(pdf_path)
+
+
+def render_page(doc: "fitz.Document", page_number: int = 0, zoom: float = 2.0) -> Image.Image:
+    """Rasterize one page of an open document to a PIL Image."""
     if page_number < 0 or page_number >= len(doc):
         raise ValueError(f"Invalid page number {page_number} for PDF with {len(doc)} pages")
     page = doc.load_page(page_number)
-    zoom = 2
     mat = fitz.Matrix(zoom, zoom)
-    pix = page.get_pixmap(matrix=mat)
-    mode = 'RGB' if pix.alpha == 0 else 'RGBA'
-    img = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
+    pix = page.get_pixmap(matrix=mat, alpha=False)
+    # Wrap the pixmap samples without copying; Image.frombytes would
+    # duplicate the full raster.
+    arr = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+    img = Image.fromarray(arr, 'RGB' if pix.n == 3 else 'RGBA')
     return img
 
 
+def _pdf_page_to_image(pdf_path: str, page_number: int = 0) -> Image.Image:
+    """Load the specified page of a PDF and convert it to a PIL Image."""
+    return render_page(open_pdf(pdf_path), page_number)
+
+
 def load_pdf(app: "MeasureAppGUI") -> None:
     if filedialog is None:
         return
@@ -40,11 +57,20 @@ def load_pdf(app: "MeasureAppGUI") -> None:
     if not path:
         return
     try:
-        img = _pdf_page_to_image(path)
+        doc = open_pdf(path)
+        img = render_page(doc, 0)
     except Exception as e:
         if messagebox:
             messagebox.showerror("Error", f"Failed to load PDF: {e}")
         return
+    # Swap in the new document, closing any previously opened one
+    old_doc = getattr(app, '_doc', None)
+    if old_doc is not None:
+        try:
+            old_doc.close()
+        except Exception:
+            pass
+    app._doc = doc
     max_w = max(800, int(app.root.winfo_width() * 0.7))
     max_h = max(600, int(app.root.winfo_height() * 0.9))
     scale = min(max_w / img.width, max_h / img.height, 1.0)
@@ -61,12 +87,22 @@ def load_pdf(app: "MeasureAppGUI") -> None:
     app.current_document_path = path
     app.image = img
     app.photo = ImageTk.PhotoImage(img)
+    app._photo_size = img.size
     app.display_image = img
+    app._display_size = img.size
     app.image_rotation = 0
+    # Drop cached rotations/mip pyramids from any previously loaded page
+    app._rot_cache = {}
+    app._mip_cache = {}
+    app._view_cache = None  # rebuilt lazily by the zoom module
+    app._photo_offset = (0, 0)
     app.zoom_level = 1.0
     app.canvas.config(scrollregion=(0, 0, img.width, img.height))
     app.canvas.delete("all")
-    app.canvas.create_image(0, 0, anchor=tk.NW, image=app.photo)
+    app._bg_item = app.canvas.create_image(0, 0, anchor=tk.NW, image=app.photo)
+    app._poly_items = set()
+    app._marker_pool = []
+    app._panel_item_pool = []
     # Reset measurement state
     app.polygons.clear()
     app.current_polygon.clear()
@@ -74,6 +110,7 @@ def load_pdf(app: "MeasureAppGUI") -> None:
     app.scale_artifact = None
     app.scale_marker_id = None
     app.scale_line_id = None
+    app._scale_artifact_items = None
     app.scale_factor = 1.0
     app.scale_unit = "units"
     app.scale_label.config(text=f"Scale: {app.scale_factor:.4f} {app.scale_unit}/pixel")
@@ -86,6 +123,16 @@ def load_pdf(app: "MeasureAppGUI") -> None:
     app.hide_zoom_preview()
 
 
+@lru_cache(maxsize=8)
+def _parse_config(raw: bytes) -> dict:
+    """Parse config JSON, memoized on the raw file content.
+
+    Users often re-load the same config between tweaks; identical bytes
+    parse once. Callers take a shallow copy before mutating.
+    """
+    return json.loads(raw.decode('utf-8'))
+
+
 def load_config(app: "MeasureAppGUI") -> None:
     if filedialog is None:
         return
@@ -93,8 +140,8 @@ def load_config(app: "MeasureAppGUI") -> None:
     if not path:
         return
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            cfg = json.load(f)
+        with open(path, 'rb') as f:
+            cfg = dict(_parse_config(f.read()))
         app.config.update(cfg)
         if messagebox:
             messagebox.showinfo("Config", "Configuration loaded.")
@@ -110,8 +157,12 @@ def save_config(app: "MeasureAppGUI") -> None:
     if not path:
         return
     try:
-        with open(path, 'w', encoding='utf-8') as f:
+        # Write-then-rename keeps the save atomic: a crash mid-dump can
+        # never leave a truncated config at the chosen path.
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(app.config, f, indent=2)
+        os.replace(tmp_path, path)
         if messagebox:
             messagebox.showinfo("Config", "Configuration saved.")
     except Exception as e:
@@ -1,853 +1,1302 @@
-#!/usr/bin/env python3
-"""
-GUI client for the architectural diagram measurement tool.
-
-This script uses the Tkinter GUI library to provide a native windowed
-experience for loading a PDF of an architectural drawing, measuring rooms by
-drawing polygons, setting a reference scale, exporting measurement data and
-performing simple panel layout optimisation.  It includes conveniences such
-as zooming, panning, rotating the loaded image, a zoom preview window and
-tools for editing polygons (straightening, vertex dragging).  It is designed
-for use on platforms where Tkinter is available (e.g. a standard Python
-installation on Windows, macOS or Linux with the Tk libraries installed).
-
-Features:
-  * Load a PDF and display the first page on a canvas.
-  * Zoom in/out and pan the diagram via buttons or right‑click dragging.
-  * Rotate the diagram in 90° increments.
-  * Draw room outlines as polygons directly on the diagram.
-  * Set a reference scale by drawing a line of known length; scale lines
-    remain visible after confirmation.
-  * Compute area and perimeter for each polygon in real units based on the
-    scale factor.
-  * Attach metadata (room ID and name) to polygons.
-  * Export all measurements and metadata to a CSV file.
-  * Generate a simple 3D extrusion of all rooms.
-  * Optimise panel layout within a selected room using a simple tiling
-    algorithm.
-  * Straighten polygons by converting near‑right angles to perfectly straight
-    segments, and undo the operation if necessary.
-  * Drag individual polygon vertices (non‑right angles) to fine‑tune shapes.
-  * Zoom preview window to help accurately place scale and polygon points.
-
-Note: This script requires Tkinter to be installed.  It cannot run in
-headless environments (such as this sandbox) where a GUI cannot be created.
-Run it locally on a system with a graphical desktop. 
-"""
-
-import importlib.util
-import json
-import math
-import sys
-from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
-
-# Soft fill colours for polygon overlays (cycled per polygon)
-POLYGON_FILL_COLORS: List[str] = [
-    '#9bd6ff',  # pale blue
-    '#c5f5c9',  # pale green
-    '#ffe0b3',  # pale orange
-    '#f7c6ff',  # pale violet
-]
-
-
-def _polygon_centroid(points: List[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
-    """Return polygon centroid; fall back to vertex average for near-zero area."""
-    if not points:
-        return None
-    area_acc = 0.0
-    cx_acc = 0.0
-    cy_acc = 0.0
-    n = len(points)
-    for i in range(n):
-        x0, y0 = points[i]
-        x1, y1 = points[(i + 1) % n]
-        cross = x0 * y1 - x1 * y0
-        area_acc += cross
-        cx_acc += (x0 + x1) * cross
-        cy_acc += (y0 + y1) * cross
-    area = area_acc / 2.0
-    if abs(area) < 1e-9:
-        avg_x = sum(p[0] for p in points) / n
-        avg_y = sum(p[1] for p in points) / n
-        return (avg_x, avg_y)
-    centroid_x = cx_acc / (6.0 * area)
-    centroid_y = cy_acc / (6.0 * area)
-    return (centroid_x, centroid_y)
-
-
-
-# Ensure required third-party packages are available before proceeding.
-REQUIRED_PACKAGES = {
-    "pymupdf": "pymupdf",
-    "PIL": "pillow",
-    "matplotlib": "matplotlib",
-}
-
-missing_packages = [
-    package_name
-    for module_name, package_name in REQUIRED_PACKAGES.items()
-    if importlib.util.find_spec(module_name) is None
-]
-
-if missing_packages:
-    unique = sorted(set(missing_packages))
-    package_list = " ".join(unique)
-    message = (
-        "Missing required packages: "
-        + ", ".join(unique)
-        + "\nInstall them with: pip install "
-        + package_list
-    )
-    print(message, file=sys.stderr)
-    raise SystemExit(1)
-
-from PIL import Image, ImageDraw
-
-try:
-    import tkinter as tk
-    from tkinter import filedialog, simpledialog, messagebox
-    from PIL import ImageTk
-except ImportError:
-    # When Tkinter is unavailable (e.g. headless environment), set tk to None.
-    tk = None  # type: ignore
-
-try:
-    from .core import facade
-except Exception:
-    import core.facade as facade  # type: ignore
-
-## Note: pdf_page_to_image and generate_3d_image have been moved to modular components:
-## - PDF loading is handled by file_io._pdf_page_to_image (via facade.file_load_pdf)
-## - 3D generation lives in three_d.generate_3d_image (via facade.three_d_show)
-
-if __package__:
-    from .core.model import (
-        PolygonData,
-        shoelace_area,
-        polygon_perimeter,
-        point_in_polygon,
-    )
-else:
-    from core.model import (
-        PolygonData,
-        shoelace_area,
-        polygon_perimeter,
-        point_in_polygon,
-    )
-
-class MeasureAppGUI:
-    """Main class encapsulating the Tkinter application."""
-
-    def __init__(self, root: tk.Tk) -> None:
-        self.root = root
-        self.root.title("Architectural Diagram Measurement Tool")
-        # Set a reasonable default size; user may resize later.
-        self.root.geometry("1200x800")
-        # Main frame contains canvas and control areas.
-        main_frame = tk.Frame(root)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        # Frame to hold canvas and its pan/zoom controls below.
-        canvas_frame = tk.Frame(main_frame)
-        canvas_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        # Canvas used to display the PDF image and drawings.
-        # Starting size gives a reasonable default; will be adjusted once a PDF
-        # is loaded.
-        self.canvas = tk.Canvas(canvas_frame, bg='gray', width=800, height=600)
-        self.canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-        # Controls for pan, zoom and rotation beneath the canvas.
-        # Rotation buttons (delegate to facade to centralize behavior)
-        # Control panel on the right for file loading and measurement options.
-        side_frame = tk.Frame(main_frame)
-        side_frame.pack(side=tk.RIGHT, fill=tk.Y)
-        tk.Button(side_frame, text="Load PDF", command=self.load_pdf).pack(fill=tk.X)
-        tk.Button(side_frame, text="Load Config", command=self.load_config).pack(fill=tk.X)
-        tk.Button(side_frame, text="Save Config", command=self.save_config).pack(fill=tk.X)
-        tk.Button(side_frame, text="Set Unit/Scale", command=self.set_scale_mode).pack(fill=tk.X)
-        tk.Button(side_frame, text="Draw Polygon", command=self.set_draw_mode).pack(fill=tk.X)
-        tk.Button(side_frame, text="Export CSV", command=self.export_csv).pack(fill=tk.X)
-        tk.Button(side_frame, text="3D View", command=self.show_3d_view).pack(fill=tk.X)
-        tk.Button(side_frame, text="Optimize Panels", command=self.optimize_panels).pack(fill=tk.X)
-        self.straighten_btn = tk.Button(side_frame, text="Straighten Polygon", command=lambda: facade.straighten_do(self))
-        self.straighten_btn.pack(fill=tk.X)
-        tk.Button(side_frame, text="Undo Straighten", command=lambda: facade.straighten_undo(self)).pack(fill=tk.X)
-        tk.Button(side_frame, text="Undo Vertex Move", command=lambda: facade.drag_undo(self)).pack(fill=tk.X)
-        tk.Button(side_frame, text="Edit Metadata", command=lambda: facade.metadata_edit(self)).pack(fill=tk.X)
-
-        zoom_frame = tk.LabelFrame(side_frame, text="Zoom")
-        zoom_frame.pack(fill=tk.X, pady=(10, 0))
-        tk.Button(zoom_frame, text="+", command=lambda: facade.zoom_in(self)).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2, pady=2)
-        tk.Button(zoom_frame, text="-", command=lambda: facade.zoom_out(self)).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2, pady=2)
-
-        pan_frame = tk.LabelFrame(side_frame, text="Pan")
-        pan_frame.pack(pady=(10, 0))
-        tk.Button(pan_frame, text='^', command=lambda: facade.pan_canvas(self, 0, -50)).grid(row=0, column=1, padx=2, pady=2)
-        tk.Button(pan_frame, text='<<', command=lambda: facade.pan_canvas(self, -50, 0)).grid(row=1, column=0, padx=2, pady=2)
-        tk.Button(pan_frame, text='Center', command=self.center_view).grid(row=1, column=1, padx=2, pady=2)
-        tk.Button(pan_frame, text='>>', command=lambda: facade.pan_canvas(self, 50, 0)).grid(row=1, column=2, padx=2, pady=2)
-        tk.Button(pan_frame, text='v', command=lambda: facade.pan_canvas(self, 0, 50)).grid(row=2, column=1, padx=2, pady=2)
-
-        rotate_frame = tk.LabelFrame(side_frame, text="Rotate")
-        rotate_frame.pack(fill=tk.X, pady=(10, 0))
-        tk.Button(rotate_frame, text='CCW', command=lambda: facade.rotate_left(self)).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2, pady=2)
-        tk.Button(rotate_frame, text='CW', command=lambda: facade.rotate_right(self)).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2, pady=2)
-        # Labels to display the current scale and selection info.
-        self.scale_unit = "units"
-        self.scale_label = tk.Label(side_frame, text=f"Scale: 1.0 {self.scale_unit}/pixel")
-        self.scale_label.pack(fill=tk.X, pady=(10, 0))
-        self.info_label = tk.Label(side_frame, text="No polygon selected.")
-        self.info_label.pack(fill=tk.X)
-        # Status bar (messages like snap notifications)
-        self.status_label = tk.Label(side_frame, text="", fg='gray')
-        self.status_label.pack(fill=tk.X)
-        # Initialize button states
-        self.update_buttons_state()
-        # Bind mouse events for drawing, panning and dragging.
-        # Left mouse button handles drawing polygons and selecting regions.
-        self.canvas.bind("<Button-1>", self.on_canvas_click)
-        # Right mouse button for panning via scan functionality.
-        self.canvas.bind("<ButtonPress-3>", lambda e: facade.pan_on_start(self, e))
-        self.canvas.bind("<B3-Motion>", lambda e: facade.pan_on_move(self, e))
-        # Motion event for zoom preview (enabled only in drawing/scale modes).
-        self.canvas.bind("<Motion>", self.on_canvas_motion)
-        # Dragging vertices (left button press, move and release) outside of draw/scale mode.
-        # Use add='+' to avoid overwriting the existing <Button-1> binding
-        self.canvas.bind("<ButtonPress-1>", lambda e: facade.drag_start(self, e), add="+")
-        self.canvas.bind("<B1-Motion>", lambda e: facade.drag_move(self, e))
-        self.canvas.bind("<ButtonRelease-1>", lambda e: facade.drag_end(self, e))
-        # Confirm/cancel for straighten preview
-
-        # Data structures and state variables.
-        self.image: Optional[Image.Image] = None  # Original PDF page (resized to fit)
-        self.photo: Optional[ImageTk.PhotoImage] = None  # PhotoImage for Tkinter display
-        self.display_image: Optional[Image.Image] = None  # PIL image currently shown on canvas (after rotation/zoom)
-        self.polygons: List[PolygonData] = []  # Completed polygons
-        self.current_polygon: List[Tuple[float, float]] = []  # Points of polygon being drawn
-        self.draw_mode: bool = False  # True when drawing a new polygon
-        self.scale_mode: bool = False  # True when setting the scale line
-        self.scale_points: List[Tuple[float, float]] = []  # Two points selected for scale
-        self.scale_artifact: Optional[dict] = None  # Persistent scale line info
-        self.scale_marker_id: Optional[int] = None  # Canvas ID for first scale point marker
-        self.scale_line_id: Optional[int] = None  # Canvas ID for scale line
-        self.scale_factor: float = 1.0  # Units per pixel
-        self.selected_polygon: Optional[int] = None  # Index of currently selected polygon
-        # Configuration (panel size and extrusion height)
-        self.config = {
-            'panel_width': 1.0,
-            'panel_height': 1.0,
-            'extrusion_height': 1.0
-        }
-        # Scale preview state
-        self.scale_preview_line_id: Optional[int] = None  # Canvas ID for scale rubber-band preview
-        # Draw preview state
-        self.draw_preview_line_id: Optional[int] = None  # Canvas ID for draw rubber-band preview
-        # Zoom/pan/rotation state
-        self.zoom_level: float = 1.0
-        self.image_rotation: int = 0  # Rotation in degrees (0, 90, 180, 270)
-        # Straightening state
-        self._straighten_backup: Optional[List[Tuple[float, float]]] = None
-        # Zoom preview window and configuration
-        self.zoom_preview_win: Optional[tk.Toplevel] = None
-        self.zoom_preview_label: Optional[tk.Label] = None
-        self.zoom_preview_size: int = 80  # Size of zoom preview window (pixels)
-        self.zoom_preview_zoom: float = 1.6  # Zoom factor for preview
-        # Dragging state
-        self.dragging: bool = False
-        self.drag_point_index: Optional[int] = None
-        self.drag_start_x: float = 0.0
-        self.drag_start_y: float = 0.0
-        self._last_pointer_canvas: Tuple[float, float] = (0.0, 0.0)
-        self.panel_tiles_overlay: Optional[dict] = None
-        self.snap_tolerance_deg: float = 3.0
-
-    # ----- Pan/Zoom/Rotate Button Setup -----
-    def center_view(self) -> None:
-        """Center the current view on the loaded image."""
-        if self.display_image is None:
-            return
-        canvas = self.canvas
-        canvas.update_idletasks()
-        view_w = max(canvas.winfo_width(), 1)
-        view_h = max(canvas.winfo_height(), 1)
-        img_w = self.display_image.width
-        img_h = self.display_image.height
-        if img_w > 0:
-            if img_w <= view_w:
-                canvas.xview_moveto(0.0)
-            else:
-                left = (img_w - view_w) / 2
-                canvas.xview_moveto(left / img_w)
-        if img_h > 0:
-            if img_h <= view_h:
-                canvas.yview_moveto(0.0)
-            else:
-                top = (img_h - view_h) / 2
-                canvas.yview_moveto(top / img_h)
-
-    # ----- Rotation Controls -----
-    def rotate_left(self) -> None:
-        """Rotate the image 90° counter‑clockwise."""
-        if self.image is None:
-            return
-        # Update rotation state and reapply rotation
-        self.image_rotation = (self.image_rotation - 90) % 360
-        self.apply_rotation()
-
-    def rotate_right(self) -> None:
-        """Rotate the image 90° clockwise."""
-        if self.image is None:
-            return
-        self.image_rotation = (self.image_rotation + 90) % 360
-        self.apply_rotation()
-
-    def apply_rotation(self) -> None:
-        """Apply the current rotation to the image and transform polygons and scale markers accordingly."""
-        if self.image is None:
-            return
-        # Rotate the original image (before scaling) and update PhotoImage
-        img = self.image.rotate(-self.image_rotation, expand=True)
-        # Also apply current zoom level
-        if self.zoom_level != 1.0:
-            new_size = (int(img.width * self.zoom_level), int(img.height * self.zoom_level))
-            try:
-                resample = Image.Resampling.LANCZOS
-            except AttributeError:
-                resample = Image.LANCZOS
-            img = img.resize(new_size, resample)
-        self.photo = ImageTk.PhotoImage(img)
-        self.display_image = img
-        self.display_image = img
-        # Update canvas scroll region
-        self.canvas.config(scrollregion=(0, 0, img.width, img.height))
-        # Transform existing polygons and scale points only when rotation
-        # changes (note: this operation is destructive on stored points).
-        if self.image_rotation != 0 and self.image is not None:
-            # Use the original (resized) image dimensions before rotation to calculate center
-            w, h = self.image.size
-            # After rotation, new dimensions of rotated image (before zoom)
-            temp_rotated = self.image.rotate(-self.image_rotation, expand=True)
-            new_w, new_h = temp_rotated.size
-            # Offset between original and rotated due to expansion
-            offset_x = (new_w - w) / 2
-            offset_y = (new_h - h) / 2
-            def rotate_point(px: float, py: float, width: float, height: float, angle: int) -> Tuple[float, float]:
-                """Rotate a point (px,py) around the centre of an image of size width x height by angle degrees."""
-                angle_rad = math.radians(angle)
-                cx, cy = width / 2, height / 2
-                dx, dy = px - cx, py - cy
-                rx = dx * math.cos(angle_rad) - dy * math.sin(angle_rad)
-                ry = dx * math.sin(angle_rad) + dy * math.cos(angle_rad)
-                return rx + cx, ry + cy
-            # Transform polygons
-            for poly in self.polygons:
-                transformed = [rotate_point(x, y, w, h, self.image_rotation) for (x, y) in poly.points]
-                # Adjust for expansion offset
-                transformed = [(x + offset_x, y + offset_y) for (x, y) in transformed]
-                poly.points = transformed
-                poly.compute_metrics()
-            # Transform current polygon
-            self.current_polygon = [rotate_point(x, y, w, h, self.image_rotation) for (x, y) in self.current_polygon]
-            self.current_polygon = [(x + offset_x, y + offset_y) for (x, y) in self.current_polygon]
-            # Transform scale points
-            self.scale_points = [rotate_point(x, y, w, h, self.image_rotation) for (x, y) in self.scale_points]
-            self.scale_points = [(x + offset_x, y + offset_y) for (x, y) in self.scale_points]
-            # Update scale artifact if present
-            if self.scale_artifact and 'points' in self.scale_artifact:
-                pts = self.scale_artifact['points']
-                pts = [rotate_point(x, y, w, h, self.image_rotation) for (x, y) in pts]
-                pts = [(x + offset_x, y + offset_y) for (x, y) in pts]
-                self.scale_artifact['points'] = pts
-        # Redraw the canvas
-        self.redraw()
-
-    # ----- Zoom and Pan -----
-    def zoom_in(self) -> None:
-        """Increase zoom level and redraw the image."""
-        self.set_zoom(self.zoom_level * 1.2)
-
-    def zoom_out(self) -> None:
-        """Decrease zoom level and redraw the image."""
-        self.set_zoom(self.zoom_level / 1.2)
-
-    def set_zoom(self, zoom: float) -> None:
-        """Set a new zoom level within allowable bounds and redraw the image."""
-        if self.image is None:
-            return
-        zoom = max(0.2, min(zoom, 5.0))
-        self.zoom_level = zoom
-        # Start from the original resized image and apply zoom and rotation.
-        img = self.image
-        # Apply rotation first to preserve orientation before scaling
-        if self.image_rotation != 0:
-            img = img.rotate(-self.image_rotation, expand=True)
-        # Apply zoom by resizing
-        new_size = (int(img.width * self.zoom_level), int(img.height * self.zoom_level))
-        try:
-            resample = Image.Resampling.LANCZOS
-        except AttributeError:
-            resample = Image.LANCZOS
-        img = img.resize(new_size, resample)
-        self.photo = ImageTk.PhotoImage(img)
-        self.display_image = img
-        # Update scroll region for panning
-        self.canvas.config(scrollregion=(0, 0, img.width, img.height))
-        # Redraw contents at new zoom level
-        self.redraw()
-
-    def pan_canvas(self, dx: int, dy: int) -> None:
-        """Pan the canvas by the specified amount (in canvas units)."""
-        self.canvas.xview_scroll(int(dx), 'units')
-        self.canvas.yview_scroll(int(dy), 'units')
-
-    # ----- Panning via Right‑click Dragging -----
-    def on_pan_start(self, event) -> None:
-        """Record the starting point for a panning operation (right‑click)."""
-        self.canvas.scan_mark(event.x, event.y)
-
-    def on_pan_move(self, event) -> None:
-        """Handle panning while dragging with the right mouse button."""
-        self.canvas.scan_dragto(event.x, event.y, gain=1)
-
-    # ----- File and Configuration Management -----
-    def load_pdf(self) -> None:
-        facade.file_load_pdf(self)
-
-    def load_config(self) -> None:
-        facade.file_load_config(self)
-
-    def save_config(self) -> None:
-        facade.file_save_config(self)
-
-    # ----- Mode Selection -----
-    def set_scale_mode(self) -> None:
-        facade.scale_set_mode(self)
-
-    def clear_scale_preview(self) -> None:
-        facade.scale_clear_preview(self)
-
-    def exit_scale_mode(self) -> None:
-        facade.scale_exit_mode(self)
-
-    def cancel_scale_mode(self, event=None) -> None:
-        facade.scale_cancel_mode(self)
-
-    def _prompt_scale_unit(self) -> Optional[str]:
-        """Prompt the user for the unit label; return None if cancelled."""
-        while True:
-            unit = simpledialog.askstring("Set Unit/Scale", "Enter units (e.g., m, cm, ft, in):")
-            if unit is None:
-                return None
-            unit = unit.strip()
-            if unit:
-                return unit
-            messagebox.showerror("Set Unit/Scale", "Unit is required.")
-
-    def _prompt_scale_length(self, unit: str) -> Optional[float]:
-        """Prompt for the real-world length in the supplied unit."""
-        while True:
-            prompt = f"Enter real-world length between the two points (in {unit}):"
-            real_len_str = simpledialog.askstring("Set Unit/Scale", prompt)
-            if real_len_str is None:
-                return None
-            try:
-                real_len = float(real_len_str)
-            except (TypeError, ValueError):
-                messagebox.showerror("Set Unit/Scale", "Enter a numeric value for the length.")
-                continue
-            if real_len <= 0:
-                messagebox.showerror("Set Unit/Scale", "Length must be greater than zero.")
-                continue
-            return real_len
-
-    def set_draw_mode(self) -> None:
-        facade.draw_set_mode(self)
-
-    # ----- Canvas Click Handling -----
-    def on_canvas_click(self, event) -> None:
-        """Handle mouse clicks on the canvas for scale definition, drawing, and selection."""
-        if self.image is None:
-            return
-        # If straighten preview is active, any left click applies it
-
-        # Convert screen coordinates to canvas coordinates (taking panning into account)
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
-        # Scale mode: collect two points and compute scale factor
-        if self.scale_mode:
-            if facade.scale_on_canvas_click(self, event):
-                return
-            return
-        # Draw mode: build up points for a new polygon
-        if self.draw_mode:
-            if facade.draw_on_canvas_click(self, event):
-                return
-        # Not in draw or scale mode: selection of an existing polygon
-        self.selected_polygon = None
-        # Convert click to image coordinates for point‑in‑polygon test
-        point = (x / self.zoom_level, y / self.zoom_level)
-        for idx, poly in enumerate(self.polygons):
-            if point_in_polygon(point, poly.points):
-                self.selected_polygon = idx
-                break
-        self.update_info_label()
-        self.redraw()
-        # Hide zoom preview when clicking outside scale/draw mode
-        self.hide_zoom_preview()
-
-    # ----- Polygon Completion -----
-    def finish_polygon(self) -> None:
-        facade.draw_finish(self)
-
-    # ----- Dragging Polygon Vertices -----
-    def on_drag_start(self, event) -> None:
-        """Initiate dragging of a polygon vertex (non‑right angles only)."""
-        if self.image is None or self.selected_polygon is None:
-            return
-        # Do not start dragging while in scale or draw mode
-        if self.scale_mode or self.draw_mode:
-            return
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
-        # Check if click is on a vertex of the selected polygon and if that vertex is a non‑right angle
-        poly = self.polygons[self.selected_polygon]
-        pts = poly.points
-        n = len(pts)
-        for i in range(n):
-            px, py = pts[i]
-            canvas_x = px * self.zoom_level
-            canvas_y = py * self.zoom_level
-            # Hit test within a small radius (8 pixels)
-            if abs(x - canvas_x) <= 8 and abs(y - canvas_y) <= 8:
-                # Compute angle at this vertex; if it's not near 90°, allow dragging
-                x_prev, y_prev = pts[i - 1]
-                x_next, y_next = pts[(i + 1) % n]
-                v1 = (px - x_prev, py - y_prev)
-                v2 = (x_next - px, y_next - py)
-                dot = v1[0] * v2[0] + v1[1] * v2[1]
-                det = v1[0] * v2[1] - v1[1] * v2[0]
-                ang = math.atan2(det, dot)
-                deg = abs(math.degrees(ang))
-                if abs(deg - 90) >= 8:
-                    self.dragging = True
-                    self.drag_point_index = i
-                    self.drag_start_x = x
-                    self.drag_start_y = y
-                    # Change cursor to indicate dragging
-                    self.canvas.config(cursor="hand2")
-                    break
-
-    def on_drag_move(self, event) -> None:
-        """Continue dragging a polygon vertex while mouse moves."""
-        if not self.dragging or self.drag_point_index is None:
-            return
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
-        poly = self.polygons[self.selected_polygon]
-        # Update vertex position (convert back to image coords)
-        new_x = x / self.zoom_level
-        new_y = y / self.zoom_level
-        poly.points[self.drag_point_index] = (new_x, new_y)
-        poly.compute_metrics()
-        self.redraw()
-        self.update_info_label()
-
-    def on_drag_end(self, event) -> None:
-        """End dragging of a polygon vertex."""
-        if self.dragging:
-            self.dragging = False
-            self.drag_point_index = None
-            self.canvas.config(cursor="")
-            self.redraw()
-            self.update_info_label()
-
-    # ----- Zoom Preview -----
-
-    def show_zoom_preview(self, x: float, y: float) -> None:
-        """Display a small window showing a magnified area around the pointer."""
-        if self.image is None:
-            return
-        src = self.display_image if self.display_image is not None else self.image
-        if src is None:
-            return
-        canvas_x = float(self.canvas.canvasx(x))
-        canvas_y = float(self.canvas.canvasy(y))
-        w, h = src.size
-        if w <= 0 or h <= 0:
-            return
-        canvas_x = max(0.0, min(canvas_x, w - 1))
-        canvas_y = max(0.0, min(canvas_y, h - 1))
-
-        preview_zoom = max(0.5, float(getattr(self, "zoom_preview_zoom", 1.0)))
-        region_size = int(round((self.zoom_preview_size / preview_zoom) * max(self.zoom_level, 0.01)))
-        region_size = max(6, region_size)
-        region_size = min(region_size, min(w, h))
-        region_size = max(2, region_size - (region_size % 2))
-        half = region_size // 2
-
-        left = int(round(canvas_x)) - half
-        upper = int(round(canvas_y)) - half
-        left = max(0, min(left, w - region_size))
-        upper = max(0, min(upper, h - region_size))
-        right = left + region_size
-        lower = upper + region_size
-
-        pointer_rel_x = canvas_x - left
-        pointer_rel_y = canvas_y - upper
-        pointer_rel_x = max(0.0, min(pointer_rel_x, region_size - 1))
-        pointer_rel_y = max(0.0, min(pointer_rel_y, region_size - 1))
-
-        crop = src.crop((left, upper, right, lower))
-        if crop.width == 0 or crop.height == 0:
-            return
-
-        scale = self.zoom_preview_size / region_size
-        px = pointer_rel_x * scale
-        py = pointer_rel_y * scale
-        px = max(0.0, min(px, self.zoom_preview_size - 1))
-        py = max(0.0, min(py, self.zoom_preview_size - 1))
-
-        zoomed = crop.resize(
-            (self.zoom_preview_size, self.zoom_preview_size),
-            Image.NEAREST
-        )
-        draw = ImageDraw.Draw(zoomed)
-        px_i = int(round(px))
-        py_i = int(round(py))
-        size_max = self.zoom_preview_size - 1
-        arm = max(6, self.zoom_preview_size // 4)
-        draw.line(
-            [(px_i, max(0, py_i - arm)), (px_i, min(size_max, py_i + arm))],
-            fill='red',
-            width=2,
-        )
-        draw.line(
-            [(max(0, px_i - arm), py_i), (min(size_max, px_i + arm), py_i)],
-            fill='red',
-            width=2,
-        )
-        dot_radius = 3
-        draw.ellipse(
-            (
-                px_i - dot_radius,
-                py_i - dot_radius,
-                px_i + dot_radius,
-                py_i + dot_radius,
-            ),
-            outline='white',
-            fill='red',
-            width=1,
-        )
-
-        preview_img = ImageTk.PhotoImage(zoomed)
-        if self.zoom_preview_win is None or not self.zoom_preview_win.winfo_exists():
-            self.zoom_preview_win = tk.Toplevel(self.root)
-            self.zoom_preview_win.title("Zoom Preview")
-            self.zoom_preview_win.resizable(False, False)
-            # Do not allow the preview window to take focus away (transient)
-            self.zoom_preview_win.transient(self.root)
-            self.zoom_preview_label = tk.Label(self.zoom_preview_win, image=preview_img)
-            self.zoom_preview_label.image = preview_img
-            self.zoom_preview_label.pack()
-        else:
-            # Update existing preview image
-            self.zoom_preview_label.config(image=preview_img)
-            self.zoom_preview_label.image = preview_img
-        # Position the preview window near the mouse pointer
-        abs_x = self.root.winfo_pointerx()
-        abs_y = self.root.winfo_pointery()
-        self.zoom_preview_win.geometry(f"+{abs_x+20}+{abs_y+20}")
-
-    def hide_zoom_preview(self) -> None:
-        """Close the zoom preview window if it is open."""
-        if self.zoom_preview_win and self.zoom_preview_win.winfo_exists():
-            self.zoom_preview_win.destroy()
-            self.zoom_preview_win = None
-            self.zoom_preview_label = None
-
-    def show_status_message(self, msg: str, duration_ms: int = 1200) -> None:
-        """Show a transient status message in the side panel."""
-        try:
-            self.status_label.config(text=msg)
-            if duration_ms > 0:
-                self.root.after(duration_ms, lambda: self.status_label.config(text=""))
-        except Exception:
-            pass
-
-    def on_canvas_motion(self, event) -> None:
-        try:
-            self._last_pointer_canvas = (float(event.x), float(event.y))
-        except Exception:
-            pass
-        facade.scale_on_motion(self, event)
-        facade.draw_on_motion(self, event)
-
-    # ----- Buttons State -----
-    def update_buttons_state(self) -> None:
-        try:
-            state = tk.NORMAL if self.selected_polygon is not None else tk.DISABLED
-            self.straighten_btn.config(state=state)
-        except Exception:
-            pass
-
-    # ----- Drawing and Display -----
-    def redraw(self) -> None:
-        """Clear and redraw the entire canvas, including image, polygons, and markers."""
-        if self.image is None or self.photo is None:
-            return
-        # Clear the canvas
-        self.canvas.delete("all")
-        # Draw the base image at origin
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
-        # Draw persistent scale line if defined
-        if self.scale_artifact and len(self.scale_artifact.get('points', [])) == 2:
-            (x1, y1), (x2, y2) = self.scale_artifact['points']
-            x1_canvas, y1_canvas = x1 * self.zoom_level, y1 * self.zoom_level
-            x2_canvas, y2_canvas = x2 * self.zoom_level, y2 * self.zoom_level
-            self.canvas.create_line(x1_canvas, y1_canvas, x2_canvas, y2_canvas,
-                                    fill='purple', width=4, dash=(6, 2))
-            self.canvas.create_oval(x1_canvas - 8, y1_canvas - 8, x1_canvas + 8, y1_canvas + 8,
-                                    fill='purple', outline='black', width=2)
-            self.canvas.create_oval(x2_canvas - 8, y2_canvas - 8, x2_canvas + 8, y2_canvas + 8,
-                                    fill='purple', outline='black', width=2)
-        # Draw marker for first scale point if still awaiting second point (in addition to any existing artifact)
-        if self.scale_mode and len(self.scale_points) == 1:
-            px, py = self.scale_points[0]
-            px_canvas, py_canvas = px * self.zoom_level, py * self.zoom_level
-            self.canvas.create_oval(px_canvas - 12, py_canvas - 12, px_canvas + 12, py_canvas + 12,
-                                    fill='blue', outline='black', width=3)
-        # Draw completed polygons
-        overlay_state = getattr(self, "panel_tiles_overlay", None)
-
-        for idx, poly in enumerate(self.polygons):
-            coords = []
-            for px, py in poly.points:
-                coords.extend([px * self.zoom_level, py * self.zoom_level])
-            fill_colour = getattr(poly, 'fill_color', POLYGON_FILL_COLORS[idx % len(POLYGON_FILL_COLORS)])
-            self.canvas.create_polygon(
-                coords,
-                fill=fill_colour,
-                outline='',
-                width=0,
-                stipple='gray12'
-            )
-            outline_color = 'red' if idx == self.selected_polygon else 'blue'
-            self.canvas.create_polygon(coords, fill='', outline=outline_color, width=2)
-            meta = getattr(poly, 'metadata', {}) or {}
-            room_id = str(meta.get('id') or '').strip()
-            room_name = str(meta.get('name') or '').strip()
-            label_lines = [
-                f"ID: {room_id or 'N/A'}",
-                f"Name: {room_name or 'N/A'}",
-            ]
-            label_text = "\n".join(label_lines)
-            centroid = _polygon_centroid(poly.points)
-            if centroid:
-                cx, cy = centroid
-                cx_canvas = cx * self.zoom_level
-                cy_canvas = cy * self.zoom_level
-                font_size = max(9, int(12 * (self.zoom_level ** 0.3)))
-                font = ("TkDefaultFont", font_size, "bold")
-                self.canvas.create_text(cx_canvas + 1, cy_canvas + 1, text=label_text, fill='white', font=font, justify=tk.CENTER)
-                self.canvas.create_text(cx_canvas, cy_canvas, text=label_text, fill='black', font=font, justify=tk.CENTER)
-            if overlay_state and overlay_state.get('polygon_index') == idx:
-                for tile in overlay_state.get('tiles', []):
-                    tile_coords: List[float] = []
-                    for tx, ty in tile.get('points', []):
-                        tile_coords.extend([tx * self.zoom_level, ty * self.zoom_level])
-                    if tile.get('type') == 'full':
-                        self.canvas.create_polygon(tile_coords, fill='', outline='green', width=1.5)
-                    elif tile.get('type') == 'partial':
-                        self.canvas.create_polygon(tile_coords, fill='', outline='orange', width=1.5, dash=(4, 2))
-        # Draw current polygon (lines connecting points) while drawing
-        if self.draw_mode and len(self.current_polygon) > 0:
-            coords = []
-            for px, py in self.current_polygon:
-                coords.extend([px * self.zoom_level, py * self.zoom_level])
-            if len(coords) >= 4:
-                self.canvas.create_line(coords, fill='green', width=2)
-            for idx, (px, py) in enumerate(self.current_polygon):
-                cx = px * self.zoom_level
-                cy = py * self.zoom_level
-                radius = 6 + (2 if idx == 0 else 0)
-                self.canvas.create_oval(
-                    cx - radius,
-                    cy - radius,
-                    cx + radius,
-                    cy + radius,
-                    fill='red',
-                    outline='white',
-                    width=2,
-                )
-        # Highlight vertices of the selected polygon with angle information
-        if self.selected_polygon is not None:
-            poly = self.polygons[self.selected_polygon]
-            pts = poly.points
-            n = len(pts)
-            for i in range(n):
-                x, y = pts[i]
-                x_prev, y_prev = pts[i - 1]
-                x_next, y_next = pts[(i + 1) % n]
-                v1 = (x - x_prev, y - y_prev)
-                v2 = (x_next - x, y_next - y)
-                # Compute angle between adjacent segments
-                dot = v1[0] * v2[0] + v1[1] * v2[1]
-                det = v1[0] * v2[1] - v1[1] * v2[0]
-                ang = math.atan2(det, dot)
-                deg = abs(math.degrees(ang))
-                # Colour code: green for near‑90° (perpendicular), red otherwise
-                color = 'green' if abs(deg - 90) < 8 else 'red'
-                px_canvas, py_canvas = x * self.zoom_level, y * self.zoom_level
-                self.canvas.create_oval(
-                    px_canvas - 6, py_canvas - 6, px_canvas + 6, py_canvas + 6,
-                    fill=color, outline='black', width=2
-                )
-
-    # ----- Information Label -----
-    def update_info_label(self) -> None:
-        """Update the info label to reflect selected polygon's metrics and metadata."""
-        # Keep buttons in sync with selection
-        self.update_buttons_state()
-        if self.selected_polygon is None:
-            self.info_label.config(text="No polygon selected.")
-            return
-        poly = self.polygons[self.selected_polygon]
-        area_real = poly.area_px * (self.scale_factor ** 2)
-        perim_real = poly.perimeter_px * self.scale_factor
-        meta = poly.metadata
-        unit_label = self.scale_unit or "units"
-        info = (
-            f"ID: {meta.get('id', '')}\n"
-            f"Name: {meta.get('name', '')}\n"
-            f"Area: {area_real:.2f} sq {unit_label}\n"
-            f"Perimeter: {perim_real:.2f} {unit_label}"
-        )
-        overlay = getattr(self, 'panel_tiles_overlay', None)
-        if overlay and overlay.get('polygon_index') == self.selected_polygon:
-            info += f"\nTiles: {overlay.get('full_count', 0)} full, {overlay.get('partial_count', 0)} partial"
-            waste_pct = overlay.get('waste_pct')
-            if waste_pct is not None:
-                info += f"\nTile waste: {waste_pct:.1f}%"
-        self.info_label.config(text=info)
-
-    # ----- Exporting Data -----
-    def export_csv(self) -> None:
-        facade.export_csv(self)
-
-    # ----- 3D Visualisation -----
-    def show_3d_view(self) -> None:
-        facade.three_d_show(self)
-
-    # ----- Panel Layout Optimisation -----
-    def optimize_panels(self) -> None:
-        facade.panels_optimize(self)
-
-def main() -> None:
-    if tk is None:
-        # Tkinter is unavailable (e.g. headless environment)
-        raise RuntimeError("Tkinter is not available in this environment. Please run this script on a system with a graphical desktop and Tk installed.")
-    root = tk.Tk()
-    app = MeasureAppGUI(root)
-    root.mainloop()
-
-if __name__ == '__main__':
-    main()
+#!/usr/bin/env python3
+"""
+GUI client for the architectural diagram measurement tool.
+
+This script uses the Tkinter GUI library to provide a native windowed
+experience for loading a PDF of an architectural drawing, measuring rooms by
+drawing polygons, setting a reference scale, exporting measurement data and
+performing simple panel layout optimisation.  It includes conveniences such
+as zooming, panning, rotating the loaded image, a zoom preview window and
+tools for editing polygons (straightening, vertex dragging).  It is designed
+for use on platforms where Tkinter is available (e.g. a standard Python
+installation on Windows, macOS or Linux with the Tk libraries installed).
+
+Features:
+  * Load a PDF and display the first page on a canvas.
+  * Zoom in/out and pan the diagram via buttons or right‑click dragging.
+  * Rotate the diagram in 90° increments.
+  * Draw room outlines as polygons directly on the diagram.
+  * Set a reference scale by drawing a line of known length; scale lines
+    remain visible after confirmation.
+  * Compute area and perimeter for each polygon in real units based on the
+    scale factor.
+  * Attach metadata (room ID and name) to polygons.
+  * Export all measurements and metadata to a CSV file.
+  * Generate a simple 3D extrusion of all rooms.
+  * Optimise panel layout within a selected room using a simple tiling
+    algorithm.
+  * Straighten polygons by converting near‑right angles to perfectly straight
+    segments, and undo the operation if necessary.
+  * Drag individual polygon vertices (non‑right angles) to fine‑tune shapes.
+  * Zoom preview window to help accurately place scale and polygon points.
+
+Note: This script requires Tkinter to be installed.  It cannot run in
+headless environments (such as this sandbox) where a GUI cannot be created.
+Run it locally on a system with a graphical desktop. 
+"""
+
+import importlib.util
+import json
+import math
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, List, Tuple, Optional
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+# Soft fill colours for polygon overlays (cycled per polygon)
+POLYGON_FILL_COLORS: List[str] = [
+    '#9bd6ff',  # pale blue
+    '#c5f5c9',  # pale green
+    '#ffe0b3',  # pale orange
+    '#f7c6ff',  # pale violet
+]
+
+
+# Pre-validates dialog input so mis-types avoid float()'s ValueError path
+_FLOAT_RE = re.compile(r'^\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*$')
+
+
+@lru_cache(maxsize=16)
+def _fill_for(index: int) -> str:
+    """Cycled fill colour for a polygon index, memoized for redraw.
+
+    Polygons normally carry a pinned ``fill_color`` from creation; this
+    is the fallback for any that predate it, and keeping the returned
+    string identical lets Tk hit its own parsed-colour cache.
+    """
+    return POLYGON_FILL_COLORS[index % len(POLYGON_FILL_COLORS)]
+
+
+# Ensure required third-party packages are available before proceeding.
+# matplotlib is only needed for the 3D view and is imported lazily there,
+# so its absence downgrades to a warning instead of blocking startup.
+REQUIRED_PACKAGES = {
+    "pymupdf": "pymupdf",
+    "PIL": "pillow",
+}
+
+OPTIONAL_PACKAGES = {
+    "matplotlib": "matplotlib",
+}
+
+# One scan of installed distributions instead of a sys.path search per
+# dependency; find_spec only runs for the (normally empty) remainder, so
+# it still catches modules installed under a different project name.
+try:
+    from importlib.metadata import distributions
+    _installed = {
+        (dist.metadata["Name"] or "").lower().replace("-", "_")
+        for dist in distributions()
+    }
+except Exception:
+    _installed = set()
+
+missing_packages = [
+    package_name
+    for module_name, package_name in REQUIRED_PACKAGES.items()
+    if package_name.lower().replace("-", "_") not in _installed
+    and importlib.util.find_spec(module_name) is None
+]
+
+missing_optional = [
+    package_name
+    for module_name, package_name in OPTIONAL_PACKAGES.items()
+    if package_name.lower().replace("-", "_") not in _installed
+    and importlib.util.find_spec(module_name) is None
+]
+
+if missing_packages:
+    unique = sorted(set(missing_packages))
+    package_list = " ".join(unique)
+    message = (
+        "Missing required packages: "
+        + ", ".join(unique)
+        + "\nInstall them with: pip install "
+        + package_list
+    )
+    print(message, file=sys.stderr)
+    raise SystemExit(1)
+
+if missing_optional:
+    unique = sorted(set(missing_optional))
+    print(
+        "Optional packages not installed (3D view disabled): "
+        + ", ".join(unique),
+        file=sys.stderr,
+    )
+
+from PIL import Image, ImageDraw
+
+try:
+    import tkinter as tk
+    from tkinter import filedialog, simpledialog, messagebox
+    from PIL import ImageTk
+except ImportError:
+    # When Tkinter is unavailable (e.g. headless environment), set tk to None.
+    tk = None  # type: ignore
+
+try:
+    from .core import facade
+    from .core import fastgeom
+except Exception:
+    import core.facade as facade  # type: ignore
+    import core.fastgeom as fastgeom  # type: ignore
+
+## Note: pdf_page_to_image and generate_3d_image have been moved to modular components:
+## - PDF loading is handled by file_io._pdf_page_to_image (via facade.file_load_pdf)
+## - 3D generation lives in three_d.generate_3d_image (via facade.three_d_show)
+
+if __package__:
+    from .core.model import (
+        PolygonData,
+        shoelace_area,
+        polygon_perimeter,
+        point_in_polygon,
+    )
+else:
+    from core.model import (
+        PolygonData,
+        shoelace_area,
+        polygon_perimeter,
+        point_in_polygon,
+    )
+
+class MeasureAppGUI:
+    """Main class encapsulating the Tkinter application."""
+
+    def __init__(self, root: tk.Tk) -> None:
+        self.root = root
+        self.root.title("Architectural Diagram Measurement Tool")
+        # Set a reasonable default size; user may resize later.
+        self.root.geometry("1200x800")
+        # Main frame contains canvas and control areas.
+        main_frame = tk.Frame(root)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        # Frame to hold canvas and its pan/zoom controls below.
+        canvas_frame = tk.Frame(main_frame)
+        canvas_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Canvas used to display the PDF image and drawings.
+        # Starting size gives a reasonable default; will be adjusted once a PDF
+        # is loaded.
+        self.canvas = tk.Canvas(canvas_frame, bg='gray', width=800, height=600)
+        self.canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # Controls for pan, zoom and rotation beneath the canvas.
+        # Rotation buttons (delegate to facade to centralize behavior)
+        # Control panel on the right for file loading and measurement options.
+        side_frame = tk.Frame(main_frame)
+        side_frame.pack(side=tk.RIGHT, fill=tk.Y)
+        tk.Button(side_frame, text="Load PDF", command=self.load_pdf).pack(fill=tk.X)
+        tk.Button(side_frame, text="Load Config", command=self.load_config).pack(fill=tk.X)
+        tk.Button(side_frame, text="Save Config", command=self.save_config).pack(fill=tk.X)
+        tk.Button(side_frame, text="Set Unit/Scale", command=self.set_scale_mode).pack(fill=tk.X)
+        tk.Button(side_frame, text="Draw Polygon", command=self.set_draw_mode).pack(fill=tk.X)
+        tk.Button(side_frame, text="Export CSV", command=self.export_csv).pack(fill=tk.X)
+        tk.Button(side_frame, text="3D View", command=self.show_3d_view).pack(fill=tk.X)
+        tk.Button(side_frame, text="Optimize Panels", command=self.optimize_panels).pack(fill=tk.X)
+        self.straighten_btn = tk.Button(side_frame, text="Straighten Polygon", command=lambda: facade.straighten_do(self))
+        self.straighten_btn.pack(fill=tk.X)
+        tk.Button(side_frame, text="Undo Straighten", command=lambda: facade.straighten_undo(self)).pack(fill=tk.X)
+        tk.Button(side_frame, text="Undo Vertex Move", command=lambda: facade.drag_undo(self)).pack(fill=tk.X)
+        tk.Button(side_frame, text="Edit Metadata", command=lambda: facade.metadata_edit(self)).pack(fill=tk.X)
+
+        zoom_frame = tk.LabelFrame(side_frame, text="Zoom")
+        zoom_frame.pack(fill=tk.X, pady=(10, 0))
+        tk.Button(zoom_frame, text="+", command=lambda: facade.zoom_in(self)).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2, pady=2)
+        tk.Button(zoom_frame, text="-", command=lambda: facade.zoom_out(self)).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2, pady=2)
+
+        pan_frame = tk.LabelFrame(side_frame, text="Pan")
+        pan_frame.pack(pady=(10, 0))
+        tk.Button(pan_frame, text='^', command=lambda: facade.pan_canvas(self, 0, -50)).grid(row=0, column=1, padx=2, pady=2)
+        tk.Button(pan_frame, text='<<', command=lambda: facade.pan_canvas(self, -50, 0)).grid(row=1, column=0, padx=2, pady=2)
+        tk.Button(pan_frame, text='Center', command=self.center_view).grid(row=1, column=1, padx=2, pady=2)
+        tk.Button(pan_frame, text='>>', command=lambda: facade.pan_canvas(self, 50, 0)).grid(row=1, column=2, padx=2, pady=2)
+        tk.Button(pan_frame, text='v', command=lambda: facade.pan_canvas(self, 0, 50)).grid(row=2, column=1, padx=2, pady=2)
+
+        rotate_frame = tk.LabelFrame(side_frame, text="Rotate")
+        rotate_frame.pack(fill=tk.X, pady=(10, 0))
+        tk.Button(rotate_frame, text='CCW', command=lambda: facade.rotate_left(self)).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2, pady=2)
+        tk.Button(rotate_frame, text='CW', command=lambda: facade.rotate_right(self)).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2, pady=2)
+        # Labels to display the current scale and selection info.
+        self.scale_unit = "units"
+        self.scale_label = tk.Label(side_frame, text=f"Scale: 1.0 {self.scale_unit}/pixel")
+        self.scale_label.pack(fill=tk.X, pady=(10, 0))
+        self.info_label = tk.Label(side_frame, text="No polygon selected.")
+        self.info_label.pack(fill=tk.X)
+        # Status bar (messages like snap notifications)
+        self.status_label = tk.Label(side_frame, text="", fg='gray')
+        self.status_label.pack(fill=tk.X)
+        # Initialize button states
+        self.update_buttons_state()
+        # Bind mouse events for drawing, panning and dragging.
+        # Left mouse button handles drawing polygons and selecting regions.
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+        # Right mouse button for panning via scan functionality.
+        self.canvas.bind("<ButtonPress-3>", lambda e: facade.pan_on_start(self, e))
+        self.canvas.bind("<B3-Motion>", lambda e: facade.pan_on_move(self, e))
+        self.canvas.bind("<ButtonRelease-3>", lambda e: facade.pan_on_end(self, e))
+        # Motion event for zoom preview (enabled only in drawing/scale modes).
+        self.canvas.bind("<Motion>", self.on_canvas_motion)
+        # Dragging vertices (left button press, move and release) outside of draw/scale mode.
+        # Use add='+' to avoid overwriting the existing <Button-1> binding
+        self.canvas.bind("<ButtonPress-1>", lambda e: facade.drag_start(self, e), add="+")
+        self.canvas.bind("<B1-Motion>", lambda e: facade.drag_move(self, e))
+        self.canvas.bind("<ButtonRelease-1>", lambda e: facade.drag_end(self, e))
+        # Re-rasterize the viewport tile when the canvas itself is resized
+        self.canvas.bind("<Configure>", lambda e: facade.zoom_refresh_tile(self))
+        # Confirm/cancel for straighten preview
+
+        # Data structures and state variables.
+        self.image: Optional[Image.Image] = None  # Original PDF page (resized to fit)
+        self.photo: Optional[ImageTk.PhotoImage] = None  # PhotoImage for Tkinter display
+        self.display_image: Optional[Image.Image] = None  # PIL image currently shown on canvas (after rotation/zoom)
+        self._display_size: Optional[Tuple[int, int]] = None  # Cached display_image.size for hot handlers
+        self._rot_cache: dict = {}  # rotation angle -> pre-rotated page image
+        self._mip_cache: dict = {}  # rotation angle -> half-resolution pyramid
+        self._photo_offset: Tuple[int, int] = (0, 0)  # Canvas position of the rendered tile
+        self._tile_job: Optional[str] = None  # Pending after_idle viewport re-tile
+        self._bg_item: Optional[int] = None  # Persistent canvas item for the page image
+        self._poly_items: set = set()  # Canvas items currently owned by live polygons
+        self._marker_pool: List[int] = []  # Reusable oval items for vertex markers
+        self._pending_motion: Optional[Tuple[int, int]] = None  # Latest coalesced pointer position
+        self._motion_job: Optional[str] = None  # Pending after() id for motion processing
+        self._redraw_pending: bool = False  # True while an idle redraw is queued
+        self._panning: bool = False  # True while a right-button scan drag is active
+        self._label_cache: Dict[Tuple[str, int], object] = {}  # Rendered label images keyed by (text, size)
+        self._labels_in_use: set = set()  # Cache keys referenced by the current redraw pass
+        self._doc = None  # Open fitz.Document for lazy multi-page access
+        self.polygons: List[PolygonData] = []  # Completed polygons
+        self.current_polygon: List[Tuple[float, float]] = []  # Points of polygon being drawn
+        self.draw_mode: bool = False  # True when drawing a new polygon
+        self.scale_mode: bool = False  # True when setting the scale line
+        self.scale_points: List[Tuple[float, float]] = []  # Two points selected for scale
+        self.scale_artifact: Optional[dict] = None  # Persistent scale line info
+        self.scale_marker_id: Optional[int] = None  # Canvas ID for first scale point marker
+        self.scale_line_id: Optional[int] = None  # Canvas ID for scale line
+        self._scale_artifact_items: Optional[Tuple[int, int, int]] = None  # Persistent line + endpoint ovals
+        self.scale_factor: float = 1.0  # Units per pixel
+        self.selected_polygon: Optional[int] = None  # Index of currently selected polygon
+        # Configuration (panel size and extrusion height)
+        self.config = {
+            'panel_width': 1.0,
+            'panel_height': 1.0,
+            'extrusion_height': 1.0
+        }
+        # Scale preview state
+        self.scale_preview_line_id: Optional[int] = None  # Canvas ID for scale rubber-band preview
+        # Draw preview state
+        self.draw_preview_line_id: Optional[int] = None  # Canvas ID for draw rubber-band preview
+        # Zoom/pan/rotation state
+        self.zoom_level: float = 1.0
+        self.image_rotation: int = 0  # Rotation in degrees (0, 90, 180, 270)
+        # Straightening state
+        self._straighten_backup: Optional[List[Tuple[float, float]]] = None
+        # Zoom preview window and configuration
+        self.zoom_preview_win: Optional[tk.Toplevel] = None
+        self.zoom_preview_label: Optional[tk.Label] = None
+        self.zoom_preview_size: int = 80  # Size of zoom preview window (pixels)
+        self.zoom_preview_zoom: float = 1.6  # Zoom factor for preview
+        # Dragging state
+        self.dragging: bool = False
+        self.drag_point_index: Optional[int] = None
+        self.drag_start_x: float = 0.0
+        self.drag_start_y: float = 0.0
+        self._last_pointer_canvas: Tuple[float, float] = (0.0, 0.0)
+        self.panel_tiles_overlay: Optional[dict] = None
+        self._panel_item_pool: List[int] = []  # Reusable tile outline items
+        self.snap_tolerance_deg: float = 3.0
+        # Compile fastgeom kernels (no-op without Numba) so the first
+        # interactive click does not pay JIT latency.
+        try:
+            fastgeom.warmup()
+        except Exception:
+            pass
+
+    # ----- Pan/Zoom/Rotate Button Setup -----
+    def center_view(self) -> None:
+        """Center the current view on the loaded image."""
+        if self.image is None or self.display_image is None:
+            return
+        canvas = self.canvas
+        canvas.update_idletasks()
+        view_w = max(canvas.winfo_width(), 1)
+        view_h = max(canvas.winfo_height(), 1)
+        # display_image may be only the viewport tile; scroll fractions
+        # are relative to the full scaled page the scrollregion spans.
+        zoom = self.zoom_level
+        base = facade.zoom_rotated_base(self)
+        img_w = base.width * zoom
+        img_h = base.height * zoom
+        if img_w > 0:
+            if img_w <= view_w:
+                canvas.xview_moveto(0.0)
+            else:
+                left = (img_w - view_w) / 2
+                canvas.xview_moveto(left / img_w)
+        if img_h > 0:
+            if img_h <= view_h:
+                canvas.yview_moveto(0.0)
+            else:
+                top = (img_h - view_h) / 2
+                canvas.yview_moveto(top / img_h)
+        # The move can land outside the rendered tile; re-tile for the new
+        # viewport so the canvas does not show a blank margin.
+        facade.zoom_refresh_tile(self)
+
+    # ----- Rotation Controls -----
+    def rotate_left(self) -> None:
+        """Rotate the image 90° counter‑clockwise."""
+        if self.image is None:
+            return
+        # Update rotation state and reapply rotation
+        self.image_rotation = (self.image_rotation - 90) % 360
+        self.apply_rotation()
+
+    def rotate_right(self) -> None:
+        """Rotate the image 90° clockwise."""
+        if self.image is None:
+            return
+        self.image_rotation = (self.image_rotation + 90) % 360
+        self.apply_rotation()
+
+    def apply_rotation(self) -> None:
+        """Apply the current rotation to the image and transform polygons and scale markers accordingly."""
+        if self.image is None:
+            return
+        # Rotate the original image (before scaling) and update PhotoImage
+        img = self.image.rotate(-self.image_rotation, expand=True)
+        # Pre-zoom dimensions of the rotated image; used below for the
+        # expansion offset instead of rotating the image a second time.
+        rot_w, rot_h = img.size
+        # Also apply current zoom level
+        if self.zoom_level != 1.0:
+            new_size = (int(img.width * self.zoom_level), int(img.height * self.zoom_level))
+            try:
+                resample = Image.Resampling.LANCZOS
+            except AttributeError:
+                resample = Image.LANCZOS
+            img = img.resize(new_size, resample)
+        self.photo = ImageTk.PhotoImage(img)
+        self.display_image = img
+        self._display_size = img.size
+        # Update canvas scroll region
+        self.canvas.config(scrollregion=(0, 0, img.width, img.height))
+        # Transform existing polygons and scale points only when rotation
+        # changes (note: this operation is destructive on stored points).
+        if self.image_rotation != 0 and self.image is not None:
+            # Use the original (resized) image dimensions before rotation to calculate center
+            w, h = self.image.size
+            # Offset between original and rotated due to expansion
+            offset_x = (rot_w - w) / 2
+            offset_y = (rot_h - h) / 2
+            angle_rad = math.radians(self.image_rotation)
+            cos_a = math.cos(angle_rad)
+            sin_a = math.sin(angle_rad)
+            def rotate_point(px: float, py: float, width: float, height: float, angle: int) -> Tuple[float, float]:
+                """Rotate a point (px,py) around the centre of an image of size width x height by angle degrees."""
+                cx, cy = width / 2, height / 2
+                dx, dy = px - cx, py - cy
+                rx = dx * cos_a - dy * sin_a
+                ry = dx * sin_a + dy * cos_a
+                return rx + cx, ry + cy
+            # Transform polygons
+            for poly in self.polygons:
+                transformed = [rotate_point(x, y, w, h, self.image_rotation) for (x, y) in poly.points]
+                # Adjust for expansion offset
+                transformed = [(x + offset_x, y + offset_y) for (x, y) in transformed]
+                poly.points = transformed
+                poly.compute_metrics()
+            # Transform current polygon
+            self.current_polygon = [rotate_point(x, y, w, h, self.image_rotation) for (x, y) in self.current_polygon]
+            self.current_polygon = [(x + offset_x, y + offset_y) for (x, y) in self.current_polygon]
+            # Transform scale points
+            self.scale_points = [rotate_point(x, y, w, h, self.image_rotation) for (x, y) in self.scale_points]
+            self.scale_points = [(x + offset_x, y + offset_y) for (x, y) in self.scale_points]
+            # Update scale artifact if present
+            if self.scale_artifact and 'points' in self.scale_artifact:
+                pts = self.scale_artifact['points']
+                pts = [rotate_point(x, y, w, h, self.image_rotation) for (x, y) in pts]
+                pts = [(x + offset_x, y + offset_y) for (x, y) in pts]
+                self.scale_artifact['points'] = pts
+        # Redraw the canvas
+        self.redraw()
+
+    # ----- Zoom and Pan -----
+    @property
+    def zoom_level(self) -> float:
+        return self._zoom_level
+
+    @zoom_level.setter
+    def zoom_level(self, value: float) -> None:
+        self._zoom_level = value
+        # Canvas-to-image conversions on motion paths multiply by this
+        # cached reciprocal instead of dividing per event.
+        self._inv_zoom = 1.0 / value if value else 1.0
+
+    def zoom_in(self) -> None:
+        """Increase zoom level and redraw the image."""
+        self.set_zoom(self.zoom_level * 1.2)
+
+    def zoom_out(self) -> None:
+        """Decrease zoom level and redraw the image."""
+        self.set_zoom(self.zoom_level / 1.2)
+
+    def set_zoom(self, zoom: float) -> None:
+        """Set a new zoom level within allowable bounds and redraw the image."""
+        if self.image is None:
+            return
+        zoom = max(0.2, min(zoom, 5.0))
+        self.zoom_level = zoom
+        # Start from the original resized image and apply zoom and rotation.
+        img = self.image
+        # Apply rotation first to preserve orientation before scaling
+        if self.image_rotation != 0:
+            img = img.rotate(-self.image_rotation, expand=True)
+        # Apply zoom by resizing
+        new_size = (int(img.width * self.zoom_level), int(img.height * self.zoom_level))
+        try:
+            resample = Image.Resampling.LANCZOS
+        except AttributeError:
+            resample = Image.LANCZOS
+        img = img.resize(new_size, resample)
+        self.photo = ImageTk.PhotoImage(img)
+        self.display_image = img
+        self._display_size = img.size
+        # Update scroll region for panning
+        self.canvas.config(scrollregion=(0, 0, img.width, img.height))
+        # Redraw contents at new zoom level
+        self.redraw()
+
+    def pan_canvas(self, dx: int, dy: int) -> None:
+        """Pan the canvas by the specified amount (in canvas units)."""
+        self.canvas.xview_scroll(int(dx), 'units')
+        self.canvas.yview_scroll(int(dy), 'units')
+
+    # ----- Panning via Right‑click Dragging -----
+    def on_pan_start(self, event) -> None:
+        """Record the starting point for a panning operation (right‑click)."""
+        self.canvas.scan_mark(event.x, event.y)
+
+    def on_pan_move(self, event) -> None:
+        """Handle panning while dragging with the right mouse button."""
+        self.canvas.scan_dragto(event.x, event.y, gain=1)
+
+    # ----- File and Configuration Management -----
+    def load_pdf(self) -> None:
+        facade.file_load_pdf(self)
+
+    def load_config(self) -> None:
+        facade.file_load_config(self)
+
+    def save_config(self) -> None:
+        facade.file_save_config(self)
+
+    # ----- Mode Selection -----
+    def set_scale_mode(self) -> None:
+        facade.scale_set_mode(self)
+
+    def clear_scale_preview(self) -> None:
+        facade.scale_clear_preview(self)
+
+    def exit_scale_mode(self) -> None:
+        facade.scale_exit_mode(self)
+
+    def cancel_scale_mode(self, event=None) -> None:
+        facade.scale_cancel_mode(self)
+
+    def _prompt_scale_unit(self) -> Optional[str]:
+        """Prompt the user for the unit label; return None if cancelled."""
+        while True:
+            unit = simpledialog.askstring("Set Unit/Scale", "Enter units (e.g., m, cm, ft, in):")
+            if unit is None:
+                return None
+            unit = unit.strip()
+            if unit:
+                return unit
+            messagebox.showerror("Set Unit/Scale", "Unit is required.")
+
+    def _prompt_scale_length(self, unit: str) -> Optional[float]:
+        """Prompt for the real-world length in the supplied unit."""
+        while True:
+            prompt = f"Enter real-world length between the two points (in {unit}):"
+            real_len_str = simpledialog.askstring("Set Unit/Scale", prompt)
+            if real_len_str is None:
+                return None
+            if not _FLOAT_RE.match(real_len_str):
+                messagebox.showerror("Set Unit/Scale", "Enter a numeric value for the length.")
+                continue
+            real_len = float(real_len_str)
+            if real_len <= 0:
+                messagebox.showerror("Set Unit/Scale", "Length must be greater than zero.")
+                continue
+            return real_len
+
+    def set_draw_mode(self) -> None:
+        facade.draw_set_mode(self)
+
+    # ----- Canvas Click Handling -----
+    def on_canvas_click(self, event) -> None:
+        """Handle mouse clicks on the canvas for scale definition, drawing, and selection."""
+        if self.image is None:
+            return
+        # If straighten preview is active, any left click applies it
+
+        # Convert screen coordinates to canvas coordinates (taking panning into account)
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        # Scale mode: collect two points and compute scale factor
+        if self.scale_mode:
+            if facade.scale_on_canvas_click(self, event):
+                return
+            return
+        # Draw mode: build up points for a new polygon
+        if self.draw_mode:
+            if facade.draw_on_canvas_click(self, event):
+                return
+        # Not in draw or scale mode: selection of an existing polygon
+        hit: Optional[int] = None
+        # Convert click to image coordinates for point‑in‑polygon test
+        point = (x * self._inv_zoom, y * self._inv_zoom)
+        px, py = point
+        for idx, poly in enumerate(self.polygons):
+            # Four comparisons against the cached bbox reject most polygons
+            # before the per-edge ray cast runs.
+            x0, y0, x1, y1 = poly.bbox
+            if not (x0 <= px <= x1 and y0 <= py <= y1):
+                continue
+            # as_array() feeds the ray cast its cached float64 buffer, so
+            # no per-click list-to-array conversion happens here.
+            if point_in_polygon(point, poly.as_array()):
+                hit = idx
+                break
+        self.set_selection(hit)
+        # Hide zoom preview when clicking outside scale/draw mode
+        self.hide_zoom_preview()
+
+    # ----- Polygon Completion -----
+    def finish_polygon(self) -> None:
+        facade.draw_finish(self)
+
+    # ----- Dragging Polygon Vertices -----
+    def on_drag_start(self, event) -> None:
+        """Initiate dragging of a polygon vertex (non‑right angles only)."""
+        if self.image is None or self.selected_polygon is None:
+            return
+        # Do not start dragging while in scale or draw mode
+        if self.scale_mode or self.draw_mode:
+            return
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        # Check if click is on a vertex of the selected polygon and if that vertex is a non‑right angle
+        poly = self.polygons[self.selected_polygon]
+        pts = poly.points
+        n = len(pts)
+        for i in range(n):
+            px, py = pts[i]
+            canvas_x = px * self.zoom_level
+            canvas_y = py * self.zoom_level
+            # Hit test within a small radius (8 pixels)
+            if abs(x - canvas_x) <= 8 and abs(y - canvas_y) <= 8:
+                # Compute angle at this vertex; if it's not near 90°, allow dragging
+                x_prev, y_prev = pts[i - 1]
+                x_next, y_next = pts[(i + 1) % n]
+                v1 = (px - x_prev, py - y_prev)
+                v2 = (x_next - px, y_next - py)
+                dot = v1[0] * v2[0] + v1[1] * v2[1]
+                det = v1[0] * v2[1] - v1[1] * v2[0]
+                ang = math.atan2(det, dot)
+                deg = abs(math.degrees(ang))
+                if abs(deg - 90) >= 8:
+                    self.dragging = True
+                    self.drag_point_index = i
+                    self.drag_start_x = x
+                    self.drag_start_y = y
+                    # Change cursor to indicate dragging
+                    self.canvas.config(cursor="hand2")
+                    break
+
+    def on_drag_move(self, event) -> None:
+        """Continue dragging a polygon vertex while mouse moves."""
+        if not self.dragging or self.drag_point_index is None:
+            return
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        poly = self.polygons[self.selected_polygon]
+        # Update vertex position (convert back to image coords)
+        new_x = x * self._inv_zoom
+        new_y = y * self._inv_zoom
+        poly.points[self.drag_point_index] = (new_x, new_y)
+        poly.compute_metrics()
+        self.redraw()
+        self.update_info_label()
+
+    def on_drag_end(self, event) -> None:
+        """End dragging of a polygon vertex."""
+        if self.dragging:
+            self.dragging = False
+            self.drag_point_index = None
+            self.canvas.config(cursor="")
+            self.redraw()
+            self.update_info_label()
+
+    # ----- Zoom Preview -----
+
+    def show_zoom_preview(self, x: float, y: float) -> None:
+        """Display a small window showing a magnified area around the pointer."""
+        if self.image is None:
+            return
+        src = self.display_image if self.display_image is not None else self.image
+        if src is None:
+            return
+        # Hot path: bind attributes to locals once per call.
+        canvas = self.canvas
+        preview_size = self.zoom_preview_size
+        canvas_x = float(canvas.canvasx(x))
+        canvas_y = float(canvas.canvasy(y))
+        if src is self.display_image:
+            # display_image may be a viewport tile; work in tile-local coords.
+            off_x, off_y = getattr(self, '_photo_offset', (0, 0))
+            canvas_x -= off_x
+            canvas_y -= off_y
+        if src is self.display_image and self._display_size is not None:
+            w, h = self._display_size
+        else:
+            w, h = src.size
+        if w <= 0 or h <= 0:
+            return
+        canvas_x = max(0.0, min(canvas_x, w - 1))
+        canvas_y = max(0.0, min(canvas_y, h - 1))
+
+        preview_zoom = max(0.5, float(getattr(self, "zoom_preview_zoom", 1.0)))
+        region_size = int(round((preview_size / preview_zoom) * max(self.zoom_level, 0.01)))
+        region_size = max(6, region_size)
+        region_size = min(region_size, min(w, h))
+        region_size = max(2, region_size - (region_size % 2))
+        half = region_size // 2
+
+        left = int(round(canvas_x)) - half
+        upper = int(round(canvas_y)) - half
+        left = max(0, min(left, w - region_size))
+        upper = max(0, min(upper, h - region_size))
+        right = left + region_size
+        lower = upper + region_size
+
+        pointer_rel_x = canvas_x - left
+        pointer_rel_y = canvas_y - upper
+        pointer_rel_x = max(0.0, min(pointer_rel_x, region_size - 1))
+        pointer_rel_y = max(0.0, min(pointer_rel_y, region_size - 1))
+
+        scale = preview_size / region_size
+        px = pointer_rel_x * scale
+        py = pointer_rel_y * scale
+        px = max(0.0, min(px, preview_size - 1))
+        py = max(0.0, min(py, preview_size - 1))
+        px_i = int(round(px))
+        py_i = int(round(py))
+
+        win_ok = self.zoom_preview_win is not None and self.zoom_preview_win.winfo_exists()
+        # Sub-pixel jitter at high zoom lands on the same integer crop and
+        # crosshair position; the displayed pixels are already current, so
+        # only the window position may need to follow the pointer.
+        key = (left, upper, region_size, preview_size, px_i, py_i)
+        if (win_ok and getattr(self, '_zoom_preview_src', None) is src
+                and getattr(self, '_zoom_preview_key', None) == key):
+            zoomed = None
+        else:
+            # Fused crop+resize: resize with a source box avoids materializing
+            # an intermediate cropped image on every motion event.
+            zoomed = src.resize(
+                (preview_size, preview_size),
+                Image.NEAREST,
+                box=(left, upper, right, lower),
+            )
+            draw = ImageDraw.Draw(zoomed)
+            size_max = preview_size - 1
+            arm = max(6, preview_size // 4)
+            draw.line(
+                [(px_i, max(0, py_i - arm)), (px_i, min(size_max, py_i + arm))],
+                fill='red',
+                width=2,
+            )
+            draw.line(
+                [(max(0, px_i - arm), py_i), (min(size_max, px_i + arm), py_i)],
+                fill='red',
+                width=2,
+            )
+            dot_radius = 3
+            draw.ellipse(
+                (
+                    px_i - dot_radius,
+                    py_i - dot_radius,
+                    px_i + dot_radius,
+                    py_i + dot_radius,
+                ),
+                outline='white',
+                fill='red',
+                width=1,
+            )
+            self._zoom_preview_src = src
+            self._zoom_preview_key = key
+
+        if zoomed is not None:
+            # Reuse one PhotoImage buffer across motion events; paste() rewrites
+            # its pixels without allocating a new Tk image per mouse move.
+            preview_photo = getattr(self, '_zoom_preview_photo', None)
+            if preview_photo is not None and getattr(self, '_zoom_preview_photo_size', None) == zoomed.size:
+                try:
+                    preview_photo.paste(zoomed)
+                except Exception:
+                    preview_photo = None
+            else:
+                preview_photo = None
+            if preview_photo is None:
+                preview_photo = ImageTk.PhotoImage(zoomed)
+                self._zoom_preview_photo = preview_photo
+                self._zoom_preview_photo_size = zoomed.size
+                if self.zoom_preview_label is not None and win_ok:
+                    self.zoom_preview_label.config(image=preview_photo)
+                    self.zoom_preview_label.image = preview_photo
+        if not win_ok:
+            self.zoom_preview_win = tk.Toplevel(self.root)
+            self.zoom_preview_win.title("Zoom Preview")
+            self.zoom_preview_win.resizable(False, False)
+            # Do not allow the preview window to take focus away (transient)
+            self.zoom_preview_win.transient(self.root)
+            self.zoom_preview_label = tk.Label(self.zoom_preview_win, image=self._zoom_preview_photo)
+            self.zoom_preview_label.image = self._zoom_preview_photo
+            self.zoom_preview_label.pack()
+            self._zoom_preview_hidden = False
+        elif getattr(self, '_zoom_preview_hidden', False):
+            self.zoom_preview_win.deiconify()
+            self._zoom_preview_hidden = False
+        # Position the preview window near the mouse pointer. geometry()
+        # round-trips to the window manager; skip it for sub-2px pointer
+        # jitter, which is invisible at the +20px offset anyway.
+        abs_x = self.root.winfo_pointerx()
+        abs_y = self.root.winfo_pointery()
+        last_pos = getattr(self, '_zoom_preview_win_pos', None)
+        if (last_pos is None or abs(abs_x - last_pos[0]) > 2
+                or abs(abs_y - last_pos[1]) > 2):
+            self.zoom_preview_win.geometry(f"+{abs_x+20}+{abs_y+20}")
+            self._zoom_preview_win_pos = (abs_x, abs_y)
+
+    def hide_zoom_preview(self) -> None:
+        """Hide the zoom preview window if it is open."""
+        if self.zoom_preview_win and self.zoom_preview_win.winfo_exists():
+            # Withdraw instead of destroy: the Toplevel, Label, and
+            # PhotoImage survive for the next show, avoiding window
+            # construction and the WM round-trips it entails on every
+            # drag end and mode exit.
+            self.zoom_preview_win.withdraw()
+            self._zoom_preview_hidden = True
+            self._zoom_preview_win_pos = None
+
+    def show_status_message(self, msg: str, duration_ms: int = 1200) -> None:
+        """Show a transient status message in the side panel."""
+        try:
+            self.status_label.config(text=msg)
+            if duration_ms > 0:
+                self.root.after(duration_ms, lambda: self.status_label.config(text=""))
+        except Exception:
+            pass
+
+    def on_canvas_motion(self, event) -> None:
+        # Coalesce high-rate <Motion> events: stash the latest position and
+        # run the real work (preview crop/resize) at most once per ~16 ms.
+        self._pending_motion = (event.x, event.y)
+        if self._motion_job is None:
+            self._motion_job = self.root.after(16, self._flush_motion)
+
+    def _flush_motion(self) -> None:
+        """Process the most recent coalesced pointer position."""
+        self._motion_job = None
+        pending = self._pending_motion
+        if pending is None:
+            return
+        self._pending_motion = None
+        x, y = pending
+        try:
+            self._last_pointer_canvas = (float(x), float(y))
+        except Exception:
+            pass
+        event = SimpleNamespace(x=x, y=y)
+        facade.scale_on_motion(self, event)
+        facade.draw_on_motion(self, event)
+
+    # ----- Buttons State -----
+    def update_buttons_state(self) -> None:
+        try:
+            state = tk.NORMAL if self.selected_polygon is not None else tk.DISABLED
+            self.straighten_btn.config(state=state)
+        except Exception:
+            pass
+
+    # ----- Drawing and Display -----
+    def _schedule_redraw(self) -> None:
+        """Queue one redraw for the next idle tick, coalescing bursts.
+
+        Event handlers that fire many times per frame (drags, rapid
+        clicks) call this instead of redraw() so Tk repaints once per
+        idle cycle rather than once per event.
+        """
+        # scan_dragto translates existing items natively, so repaints
+        # during a pan would only fight it; the release handler refreshes.
+        if self._panning:
+            return
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        self._redraw_pending = False
+        self.redraw()
+
+    # Rendered room labels are cheap to regenerate, so eviction past this
+    # count just drops everything the current redraw pass has not touched;
+    # keys in _labels_in_use back canvas items painted earlier in the same
+    # pass, and dropping their PhotoImages would blank those labels.
+    _LABEL_CACHE_MAX = 128
+
+    def _label_photo(self, text: str, font_size: int):
+        """Room label (black text over a white shadow) as a cached PhotoImage.
+
+        Rasterizing both layers into one transparent image halves the
+        per-label canvas item count and skips Tk's text layout entirely on
+        cached frames; the image is rebuilt only when the text or the
+        zoom-derived size changes.
+        """
+        key = (text, font_size)
+        self._labels_in_use.add(key)
+        photo = self._label_cache.get(key)
+        if photo is not None:
+            return photo
+        from PIL import Image, ImageDraw, ImageFont, ImageTk
+        try:
+            pil_font = ImageFont.truetype("DejaVuSans-Bold.ttf", font_size + 2)
+        except Exception:
+            pil_font = ImageFont.load_default()
+        probe = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+        x0, y0, x1, y1 = probe.multiline_textbbox((0, 0), text, font=pil_font, align='center')
+        img = Image.new('RGBA', (x1 - x0 + 2, y1 - y0 + 2), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw.multiline_text((1 - x0, 1 - y0), text, fill='white', font=pil_font, align='center')
+        draw.multiline_text((-x0, -y0), text, fill='black', font=pil_font, align='center')
+        if len(self._label_cache) >= self._LABEL_CACHE_MAX:
+            in_use = self._labels_in_use
+            for stale in [k for k in self._label_cache if k not in in_use]:
+                del self._label_cache[stale]
+        photo = ImageTk.PhotoImage(img)
+        self._label_cache[key] = photo
+        return photo
+
+    def redraw(self) -> None:
+        """Clear and redraw the entire canvas, including image, polygons, and markers."""
+        if self.image is None or self.photo is None:
+            return
+        # Hoist hot attribute/method lookups out of the per-vertex loops.
+        canvas = self.canvas
+        zoom = self.zoom_level
+        create_polygon = canvas.create_polygon
+        create_oval = canvas.create_oval
+        selected = self.selected_polygon
+        # Incremental update: the background image and per-polygon items
+        # persist across redraws and are repositioned in place; everything
+        # else (labels, scale artifacts, previews) is cheap and transient,
+        # carries the 'overlay' tag, and is rebuilt each pass.
+        canvas.delete('overlay')
+        canvas.delete('sel_markers')
+        self._hide_marker_pool()
+        # Draw the base image tile at its viewport offset
+        off_x, off_y = getattr(self, '_photo_offset', (0, 0))
+        bg = getattr(self, '_bg_item', None)
+        if bg is not None:
+            try:
+                canvas.itemconfigure(bg, image=self.photo)
+                canvas.coords(bg, off_x, off_y)
+            except tk.TclError:
+                bg = None
+        if bg is None:
+            self._bg_item = canvas.create_image(off_x, off_y, anchor=tk.NW, image=self.photo)
+            canvas.tag_lower(self._bg_item)
+        # Draw persistent scale line if defined; the line and endpoint
+        # ovals are long-lived items repositioned in place, like the
+        # polygon items below.
+        scale_items = getattr(self, '_scale_artifact_items', None)
+        if self.scale_artifact and len(self.scale_artifact.get('points', [])) == 2:
+            (x1, y1), (x2, y2) = self.scale_artifact['points']
+            x1_canvas, y1_canvas = x1 * zoom, y1 * zoom
+            x2_canvas, y2_canvas = x2 * zoom, y2 * zoom
+            if scale_items is not None:
+                try:
+                    line_id, oval1, oval2 = scale_items
+                    canvas.coords(line_id, x1_canvas, y1_canvas, x2_canvas, y2_canvas)
+                    canvas.coords(oval1, x1_canvas - 8, y1_canvas - 8, x1_canvas + 8, y1_canvas + 8)
+                    canvas.coords(oval2, x2_canvas - 8, y2_canvas - 8, x2_canvas + 8, y2_canvas + 8)
+                    for item in scale_items:
+                        canvas.itemconfigure(item, state='normal')
+                except tk.TclError:
+                    scale_items = None
+            if scale_items is None:
+                line_id = canvas.create_line(x1_canvas, y1_canvas, x2_canvas, y2_canvas,
+                                             fill='purple', width=4, dash=(6, 2))
+                oval1 = create_oval(x1_canvas - 8, y1_canvas - 8, x1_canvas + 8, y1_canvas + 8,
+                                    fill='purple', outline='black', width=2)
+                oval2 = create_oval(x2_canvas - 8, y2_canvas - 8, x2_canvas + 8, y2_canvas + 8,
+                                    fill='purple', outline='black', width=2)
+                self._scale_artifact_items = (line_id, oval1, oval2)
+        elif scale_items is not None:
+            for item in scale_items:
+                try:
+                    canvas.itemconfigure(item, state='hidden')
+                except tk.TclError:
+                    pass
+        # Draw marker for first scale point if still awaiting second point
+        # (in addition to any existing artifact). This is the same
+        # persistent item scale.py places on the first click; repositioning
+        # it here keeps it correct when the user zooms or rotates between
+        # the two clicks, instead of leaving it at stale canvas coordinates.
+        marker = getattr(self, 'scale_marker_id', None)
+        if self.scale_mode and len(self.scale_points) == 1:
+            px, py = self.scale_points[0]
+            px_canvas, py_canvas = px * zoom, py * zoom
+            if marker is not None:
+                try:
+                    canvas.coords(marker, px_canvas - 12, py_canvas - 12,
+                                  px_canvas + 12, py_canvas + 12)
+                    canvas.itemconfigure(marker, state='normal')
+                except tk.TclError:
+                    marker = None
+            if marker is None:
+                self.scale_marker_id = create_oval(
+                    px_canvas - 12, py_canvas - 12, px_canvas + 12, py_canvas + 12,
+                    fill='blue', outline='black', width=3)
+        elif marker is not None:
+            try:
+                canvas.itemconfigure(marker, state='hidden')
+            except tk.TclError:
+                self.scale_marker_id = None
+        # Draw completed polygons, reusing their canvas items where possible
+        overlay_state = getattr(self, "panel_tiles_overlay", None)
+        live_items = set()
+        # Label size depends only on the zoom level; compute it once per
+        # frame instead of once per polygon. Each pass starts with an empty
+        # in-use set so label-cache eviction can never drop a photo some
+        # item created earlier in the same pass still displays.
+        self._labels_in_use.clear()
+        font_size = max(9, int(12 * (zoom ** 0.3)))
+        # Visible canvas window for bbox culling, in canvas coordinates
+        view_x0 = canvas.canvasx(0)
+        view_y0 = canvas.canvasy(0)
+        view_x1 = view_x0 + max(canvas.winfo_width(), 1)
+        view_y1 = view_y0 + max(canvas.winfo_height(), 1)
+
+        for idx, poly in enumerate(self.polygons):
+            bx0, by0, bx1, by1 = poly.bbox
+            if (bx1 * zoom < view_x0 or bx0 * zoom > view_x1
+                    or by1 * zoom < view_y0 or by0 * zoom > view_y1):
+                # Entirely off-screen: keep the items but hide them so pan
+                # cost tracks visible polygons only.
+                for item in (getattr(poly, '_fill_item', None),
+                             getattr(poly, '_outline_item', None)):
+                    if item is not None:
+                        try:
+                            canvas.itemconfigure(item, state='hidden')
+                            live_items.add(item)
+                        except tk.TclError:
+                            pass
+                poly._items_hidden = True
+                continue
+            coords = poly.display_coords(zoom)
+            fill_colour = getattr(poly, 'fill_color', None) or _fill_for(idx)
+            outline_color = 'red' if idx == selected else 'blue'
+            # display_coords returns the identical cached list while the
+            # polygon and zoom are unchanged, so object identity tells us
+            # whether the Tcl-side coordinates need to be rewritten; the
+            # style caches do the same for itemconfigure. On a pure pan
+            # this loop then issues no Tcl calls at all.
+            moved = getattr(poly, '_pushed_coords', None) is not coords
+            hidden = getattr(poly, '_items_hidden', False)
+            fill_item = getattr(poly, '_fill_item', None)
+            if fill_item is not None:
+                try:
+                    if moved:
+                        canvas.coords(fill_item, *coords)
+                    if hidden or getattr(poly, '_last_fill', None) != fill_colour:
+                        canvas.itemconfigure(fill_item, fill=fill_colour, state='normal')
+                except tk.TclError:
+                    fill_item = None
+            if fill_item is None:
+                fill_item = poly._fill_item = create_polygon(
+                    coords,
+                    fill=fill_colour,
+                    outline='',
+                    width=0,
+                    stipple='gray12'
+                )
+            outline_item = getattr(poly, '_outline_item', None)
+            if outline_item is not None:
+                try:
+                    if moved:
+                        canvas.coords(outline_item, *coords)
+                    if hidden or getattr(poly, '_last_outline', None) != outline_color:
+                        canvas.itemconfigure(outline_item, outline=outline_color, state='normal')
+                except tk.TclError:
+                    outline_item = None
+            if outline_item is None:
+                outline_item = poly._outline_item = create_polygon(
+                    coords, fill='', outline=outline_color, width=2)
+            poly._pushed_coords = coords
+            poly._items_hidden = False
+            poly._last_fill = fill_colour
+            poly._last_outline = outline_color
+            live_items.add(fill_item)
+            live_items.add(outline_item)
+            meta = getattr(poly, 'metadata', {}) or {}
+            room_id = str(meta.get('id') or '').strip()
+            room_name = str(meta.get('name') or '').strip()
+            label_lines = [
+                f"ID: {room_id or 'N/A'}",
+                f"Name: {room_name or 'N/A'}",
+            ]
+            label_text = "\n".join(label_lines)
+            centroid = poly.centroid_px()
+            if centroid:
+                cx, cy = centroid
+                cx_canvas = cx * zoom
+                cy_canvas = cy * zoom
+                canvas.create_image(cx_canvas, cy_canvas,
+                                    image=self._label_photo(label_text, font_size),
+                                    tags=('overlay',))
+        # Panel tile outlines: a dense layout can run to thousands of
+        # rectangles, so the items are pooled and repositioned instead of
+        # recreated; extras beyond this pass's tile count are hidden.
+        tiles = []
+        if overlay_state and 0 <= overlay_state.get('polygon_index', -1) < len(self.polygons):
+            tiles = overlay_state.get('tiles', [])
+        pool = self._panel_item_pool
+        used = 0
+        for tile in tiles:
+            tile_coords = [c * zoom for pt in tile.get('points', []) for c in pt]
+            if not tile_coords:
+                continue
+            if tile.get('type') == 'full':
+                outline, dash = 'green', ''
+            elif tile.get('type') == 'partial':
+                outline, dash = 'orange', (4, 2)
+            else:
+                continue
+            item = pool[used] if used < len(pool) else None
+            if item is not None:
+                try:
+                    canvas.coords(item, *tile_coords)
+                    canvas.itemconfigure(item, outline=outline, dash=dash, state='normal')
+                except tk.TclError:
+                    item = None
+            if item is None:
+                item = create_polygon(tile_coords, fill='', outline=outline,
+                                      width=1.5, dash=dash)
+                if used < len(pool):
+                    pool[used] = item
+                else:
+                    pool.append(item)
+            used += 1
+        for item in pool[used:]:
+            try:
+                canvas.itemconfigure(item, state='hidden')
+            except tk.TclError:
+                pass
+        # Drop items belonging to polygons that no longer exist
+        stale = getattr(self, '_poly_items', set()) - live_items
+        for item in stale:
+            canvas.delete(item)
+        self._poly_items = live_items
+        # Draw current polygon (lines connecting points) while drawing
+        if self.draw_mode and len(self.current_polygon) > 0:
+            if np is not None:
+                # One vectorized multiply instead of a per-point Python loop.
+                scaled_pts = (np.asarray(self.current_polygon, dtype=np.float64) * zoom).tolist()
+            else:
+                scaled_pts = [(px * zoom, py * zoom) for px, py in self.current_polygon]
+            coords = [c for pt in scaled_pts for c in pt]
+            if len(coords) >= 4:
+                canvas.create_line(coords, fill='green', width=2, tags=('overlay',))
+            for idx, (cx, cy) in enumerate(scaled_pts):
+                radius = 6 + (2 if idx == 0 else 0)
+                create_oval(
+                    cx - radius,
+                    cy - radius,
+                    cx + radius,
+                    cy + radius,
+                    fill='red',
+                    outline='white',
+                    width=2,
+                    tags=('overlay',),
+                )
+        # Highlight vertices of the selected polygon with angle information
+        if self.selected_polygon is not None:
+            self._draw_selection_markers(self.selected_polygon)
+
+    # Polygons denser than this get their vertex markers rasterized into a
+    # single image overlay instead of one create_oval per vertex.
+    _MARKER_BATCH_THRESHOLD = 50
+
+    def _draw_selection_markers(self, idx: int) -> None:
+        """Draw angle-coded vertex markers for the polygon at ``idx``."""
+        poly = self.polygons[idx]
+        pts = poly.points
+        if not pts:
+            return
+        # Right-angle classification runs through fastgeom; the sin-threshold
+        # form avoids an atan2/degrees pair per vertex. Passing the cached
+        # vertex array skips a fresh list->ndarray conversion.
+        mask = fastgeom.right_angle_mask(poly.as_array(), 8.0)
+        zoom = self.zoom_level
+        if len(pts) > self._MARKER_BATCH_THRESHOLD:
+            # One PIL pass plus a single create_image replaces N Tcl calls.
+            r = 6
+            xs = [p[0] * zoom for p in pts]
+            ys = [p[1] * zoom for p in pts]
+            left = int(math.floor(min(xs))) - r - 2
+            top = int(math.floor(min(ys))) - r - 2
+            width = int(math.ceil(max(xs))) - left + r + 2
+            height = int(math.ceil(max(ys))) - top + r + 2
+            layer = Image.new('RGBA', (max(width, 1), max(height, 1)), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(layer)
+            for cx, cy, is_right in zip(xs, ys, mask):
+                color = 'green' if is_right else 'red'
+                draw.ellipse(
+                    (cx - left - r, cy - top - r, cx - left + r, cy - top + r),
+                    fill=color, outline='black', width=2,
+                )
+            self._marker_layer_photo = ImageTk.PhotoImage(layer)
+            self.canvas.create_image(
+                left, top, anchor=tk.NW,
+                image=self._marker_layer_photo, tags=('sel_markers',)
+            )
+            return
+        # Pool of persistent oval items: move/recolor existing ones and only
+        # create new items when the vertex count outgrows the pool.
+        canvas = self.canvas
+        pool = self._marker_pool
+        for i, ((x, y), is_right) in enumerate(zip(pts, mask)):
+            # Colour code: green for near‑90° (perpendicular), red otherwise
+            color = 'green' if is_right else 'red'
+            px_canvas, py_canvas = x * zoom, y * zoom
+            box = (px_canvas - 6, py_canvas - 6, px_canvas + 6, py_canvas + 6)
+            item = pool[i] if i < len(pool) else None
+            if item is not None:
+                try:
+                    canvas.coords(item, *box)
+                    canvas.itemconfigure(item, fill=color, state='normal')
+                    continue
+                except tk.TclError:
+                    item = None
+            item = canvas.create_oval(*box, fill=color, outline='black', width=2)
+            if i < len(pool):
+                pool[i] = item
+            else:
+                pool.append(item)
+        self._hide_marker_pool(from_index=len(pts))
+
+    def _hide_marker_pool(self, from_index: int = 0) -> None:
+        """Hide pooled vertex-marker items from ``from_index`` onward."""
+        canvas = self.canvas
+        for item in self._marker_pool[from_index:]:
+            try:
+                canvas.itemconfigure(item, state='hidden')
+            except tk.TclError:
+                pass
+
+    def set_selection(self, new_idx: Optional[int]) -> None:
+        """Change the selected polygon without a full canvas redraw.
+
+        Only the two affected outlines and the vertex markers are touched;
+        geometry and zoom changes still go through redraw().
+        """
+        prev = self.selected_polygon
+        if new_idx == prev:
+            self.update_info_label()
+            return
+        self.selected_polygon = new_idx
+        prev_item = (
+            getattr(self.polygons[prev], '_outline_item', None)
+            if prev is not None and prev < len(self.polygons) else None
+        )
+        new_item = (
+            getattr(self.polygons[new_idx], '_outline_item', None)
+            if new_idx is not None else None
+        )
+        if (prev is not None and prev_item is None) or (new_idx is not None and new_item is None):
+            # Items not materialized yet; fall back to a full repaint.
+            self.update_info_label()
+            self.redraw()
+            return
+        try:
+            if prev_item is not None:
+                self.canvas.itemconfigure(prev_item, outline='blue')
+            if new_item is not None:
+                self.canvas.itemconfigure(new_item, outline='red')
+            self.canvas.delete('sel_markers')
+            self._hide_marker_pool()
+            if new_idx is not None:
+                self._draw_selection_markers(new_idx)
+        except Exception:
+            self.redraw()
+        self.update_info_label()
+
+    # ----- Information Label -----
+    def update_info_label(self) -> None:
+        """Update the info label to reflect selected polygon's metrics and metadata."""
+        # Keep buttons in sync with selection
+        self.update_buttons_state()
+        if self.selected_polygon is None:
+            self.info_label.config(text="No polygon selected.")
+            return
+        poly = self.polygons[self.selected_polygon]
+        sf = self.scale_factor
+        area_real = poly.area_px * sf * sf
+        perim_real = poly.perimeter_px * sf
+        meta = poly.metadata
+        unit_label = self.scale_unit or "units"
+        info = (
+            f"ID: {meta.get('id', '')}\n"
+            f"Name: {meta.get('name', '')}\n"
+            f"Area: {area_real:.2f} sq {unit_label}\n"
+            f"Perimeter: {perim_real:.2f} {unit_label}"
+        )
+        overlay = getattr(self, 'panel_tiles_overlay', None)
+        if overlay and overlay.get('polygon_index') == self.selected_polygon:
+            info += f"\nTiles: {overlay.get('full_count', 0)} full, {overlay.get('partial_count', 0)} partial"
+            waste_pct = overlay.get('waste_pct')
+            if waste_pct is not None:
+                info += f"\nTile waste: {waste_pct:.1f}%"
+        self.info_label.config(text=info)
+
+    # ----- Exporting Data -----
+    def export_csv(self) -> None:
+        facade.export_csv(self)
+
+    # ----- 3D Visualisation -----
+    def show_3d_view(self) -> None:
+        facade.three_d_show(self)
+
+    # ----- Panel Layout Optimisation -----
+    def optimize_panels(self) -> None:
+        facade.panels_optimize(self)
+
+def main() -> None:
+    if tk is None:
+        # Tkinter is unavailable (e.g. headless environment)
+        raise RuntimeError("Tkinter is not available in this environment. Please run this script on a system with a graphical desktop and Tk installed.")
+    root = tk.Tk()
+    app = MeasureAppGUI(root)
+    root.mainloop()
+
+if __name__ == '__main__':
+    main()
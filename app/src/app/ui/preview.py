@@ -37,13 +37,37 @@ def show_zoom_preview(app: "MeasureAppGUI", x: float, y: float) -> None:
     if lower <= upper:
         lower = min(upper + 1, h)
         upper = max(0, lower - 1)
-    crop = src.crop((left, upper, right, lower))
-    zoomed = crop.resize((app.zoom_preview_size, app.zoom_preview_size), Image.NEAREST)
+    win_ok = app.zoom_preview_win is not None and app.zoom_preview_win.winfo_exists()
+    box = (left, upper, right, lower, app.zoom_preview_size)
+    if (win_ok and getattr(app, '_preview_src', None) is src
+            and getattr(app, '_preview_box', None) == box):
+        # Sub-pixel jitter at high zoom lands on the same integer crop;
+        # the displayed pixels are already current, so only the window
+        # position may need to follow the pointer.
+        zoomed = None
+    else:
+        out_size = (app.zoom_preview_size, app.zoom_preview_size)
+        if (right - left, lower - upper) == out_size:
+            # Region already matches the preview size: crop alone, no
+            # resample pass.
+            zoomed = src.crop((left, upper, right, lower))
+        else:
+            # Fused crop+resize: the box argument samples straight from the
+            # source, skipping the intermediate crop allocation on this
+            # mouse-motion path. NEAREST for the usual magnification;
+            # BILINEAR if a clamped edge region ever needs shrinking.
+            resample = (Image.NEAREST if (right - left) <= out_size[0]
+                        else Image.BILINEAR)
+            zoomed = src.resize(out_size, resample, box=(left, upper, right, lower))
+        app._preview_src = src
+        app._preview_box = box
     from PIL import ImageTk
-    preview_img = ImageTk.PhotoImage(zoomed)
-    if app.zoom_preview_win is None or not app.zoom_preview_win.winfo_exists():
+    if not win_ok:
         if tk is None:
             return
+        preview_img = ImageTk.PhotoImage(zoomed)
+        app._preview_photo = preview_img
+        app._preview_photo_size = zoomed.size
         app.zoom_preview_win = tk.Toplevel(app.root)
         app.zoom_preview_win.title("Zoom Preview")
         app.zoom_preview_win.resizable(False, False)
@@ -51,17 +75,38 @@ def show_zoom_preview(app: "MeasureAppGUI", x: float, y: float) -> None:
         app.zoom_preview_label = tk.Label(app.zoom_preview_win, image=preview_img)
         app.zoom_preview_label.image = preview_img
         app.zoom_preview_label.pack()
+    elif zoomed is None:
+        pass
+    elif getattr(app, '_preview_photo_size', None) == zoomed.size:
+        # Repaint in place: pasting into the existing PhotoImage skips a
+        # fresh Tk image allocation per motion event.
+        app._preview_photo.paste(zoomed)
     else:
+        preview_img = ImageTk.PhotoImage(zoomed)
+        app._preview_photo = preview_img
+        app._preview_photo_size = zoomed.size
         app.zoom_preview_label.config(image=preview_img)
         app.zoom_preview_label.image = preview_img
+    if getattr(app, '_preview_hidden', False):
+        app.zoom_preview_win.deiconify()
+        app._preview_hidden = False
     abs_x = app.root.winfo_pointerx()
     abs_y = app.root.winfo_pointery()
-    app.zoom_preview_win.geometry(f"+{abs_x+20}+{abs_y+20}")
+    # geometry() round-trips to the window manager; skip it for sub-2px
+    # pointer jitter, which is invisible at the +20px offset anyway.
+    last_pos = getattr(app, '_preview_win_pos', None)
+    if (last_pos is None or abs(abs_x - last_pos[0]) > 2
+            or abs(abs_y - last_pos[1]) > 2):
+        app.zoom_preview_win.geometry(f"+{abs_x + 20}+{abs_y + 20}")
+        app._preview_win_pos = (abs_x, abs_y)
 
 
 def hide_zoom_preview(app: "MeasureAppGUI") -> None:
     if app.zoom_preview_win and app.zoom_preview_win.winfo_exists():
-        app.zoom_preview_win.destroy()
-        app.zoom_preview_win = None
-        app.zoom_preview_label = None
-
+        # Withdraw instead of destroy: the Toplevel, Label, and
+        # PhotoImage survive for the next show, avoiding window
+        # construction and the WM round-trips it entails.
+        app.zoom_preview_win.withdraw()
+        app._preview_hidden = True
+        app._preview_win_pos = None
+
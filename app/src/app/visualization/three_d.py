@@ -1,16 +1,34 @@
 ﻿from __future__ import annotations
 
-import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, List, Tuple
 
+import numpy as np
 from PIL import Image
 
-try:
-    import matplotlib
-    matplotlib.use('Agg')
-    from matplotlib import pyplot as plt
-except Exception:  # pragma: no cover
-    plt = None  # type: ignore
+# matplotlib costs several hundred ms to import, so it is loaded lazily
+# on the first "3D View" request instead of at application startup.
+plt = None  # type: ignore
+FigureCanvasAgg = None  # type: ignore
+Poly3DCollection = None  # type: ignore
+
+
+def _load_matplotlib() -> bool:
+    global plt, FigureCanvasAgg, Poly3DCollection
+    if plt is not None:
+        return True
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib import pyplot
+        from matplotlib.backends.backend_agg import FigureCanvasAgg as _agg
+        from mpl_toolkits.mplot3d.art3d import Poly3DCollection as _p3d
+    except Exception:  # pragma: no cover
+        return False
+    plt = pyplot
+    FigureCanvasAgg = _agg
+    Poly3DCollection = _p3d
+    return True
 
 try:
     import tkinter as tk
@@ -21,24 +39,115 @@ if TYPE_CHECKING:
     from .gui_client import MeasureAppGUI
 
 
+# matplotlib's default color cycle, for the PIL fallback renderer.
+_TAB10 = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+          '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf')
+
+
+def _generate_3d_image_pil(polygons: List[List[Tuple[float, float]]],
+                           height: float, size: int = 600) -> Image.Image:
+    """Orthographic extrusion render using PIL only.
+
+    Covers the 3D view when matplotlib is not installed: all vertices are
+    projected with one matmul per ring and the faces painted back-to-front
+    (painter's algorithm), which skips the matplotlib figure, its Agg
+    draw, and its per-artist overhead entirely.
+    """
+    from PIL import ImageDraw
+    elev = np.radians(20.0)
+    azim = np.radians(30.0)
+    ca, sa = np.cos(azim), np.sin(azim)
+    ce, se = np.cos(elev), np.sin(elev)
+
+    faces = []  # (mean_depth, screen_ring, fill, outline)
+    proj_pts = []
+    for idx, pts in enumerate(polygons):
+        if len(pts) < 3:
+            continue
+        n = len(pts)
+        color = _TAB10[idx % len(_TAB10)]
+        ring = np.asarray(pts, dtype=np.float64)
+        for z in (0.0, height):
+            xyz = np.column_stack([ring, np.full(n, z)])
+            # Rotate about z by azim, then tilt about x by elev.
+            x1 = xyz[:, 0] * ca + xyz[:, 1] * sa
+            y1 = -xyz[:, 0] * sa + xyz[:, 1] * ca
+            sy = y1 * se + xyz[:, 2] * ce
+            depth = y1 * ce - xyz[:, 2] * se
+            proj = np.column_stack([x1, -sy, depth])
+            proj_pts.append(proj)
+        bottom, top = proj_pts[-2], proj_pts[-1]
+        faces.append((float(bottom[:, 2].mean()), bottom[:, :2], color))
+        faces.append((float(top[:, 2].mean()), top[:, :2], color))
+        for i in range(n):
+            j = (i + 1) % n
+            quad = np.vstack([bottom[i], bottom[j], top[j], top[i]])
+            faces.append((float(quad[:, 2].mean()), quad[:, :2], color))
+
+    img = Image.new('RGB', (size, size), 'white')
+    if not faces:
+        return img
+    allpts = np.vstack([ring for _, ring, _ in faces])
+    mins = allpts.min(axis=0)
+    spans = allpts.max(axis=0) - mins
+    scale = (size - 40) / max(float(spans.max()), 1e-9)
+    offset = (size - spans * scale) / 2.0
+    draw = ImageDraw.Draw(img)
+    # Painter's algorithm: farthest faces first.
+    for _, ring, color in sorted(faces, key=lambda f: -f[0]):
+        screen = (ring - mins) * scale + offset
+        draw.polygon([tuple(p) for p in screen.tolist()],
+                     fill=color, outline='black')
+    return img
+
+
+# Figure construction costs tens of milliseconds per call, so one figure
+# (with its 3D axes and Agg canvas) is built lazily and reused; ax.cla()
+# resets it between renders. The single-worker render executor means only
+# one render touches it at a time.
+_FIG = None
+_AX = None
+_CANVAS = None
+
+
+def _get_fig():
+    global _FIG, _AX, _CANVAS
+    if _FIG is None:
+        _FIG = plt.figure(figsize=(6, 6), dpi=100)
+        _AX = _FIG.add_subplot(111, projection='3d')
+        _CANVAS = FigureCanvasAgg(_FIG)
+    return _FIG, _AX, _CANVAS
+
+
 def generate_3d_image(polygons: List[List[Tuple[float, float]]], height: float = 1.0) -> Image.Image:
-    if plt is None:
-        raise RuntimeError("matplotlib is not available")
-    fig = plt.figure(figsize=(6, 6))
-    ax = fig.add_subplot(111, projection='3d')
+    if not _load_matplotlib():
+        return _generate_3d_image_pil(polygons, height)
+    fig, ax, canvas = _get_fig()
+    ax.cla()
+    # One Poly3DCollection for the whole scene: bottom face, top face,
+    # and one quad per side edge. A single collection keeps the artist
+    # count constant, where per-edge ax.plot calls make draw() cost
+    # scale with total edge count.
+    faces = []
+    colors = []
     for idx, pts in enumerate(polygons):
         if len(pts) < 3:
             continue
-        xs = [p[0] for p in pts] + [pts[0][0]]
-        ys = [p[1] for p in pts] + [pts[0][1]]
-        zs_bottom = [0] * len(xs)
-        zs_top = [height] * len(xs)
+        n = len(pts)
         color = f'C{idx % 10}'
-        ax.plot(xs, ys, zs_bottom, color=color, alpha=0.6)
-        ax.plot(xs, ys, zs_top, color=color, alpha=0.6)
-        for i in range(len(pts)):
-            x0, y0 = pts[i]
-            ax.plot([x0, x0], [y0, y0], [0, height], color=color, alpha=0.6)
+        ring = np.asarray(pts, dtype=np.float64)
+        bottom = np.column_stack([ring, np.zeros(n)])
+        top = np.column_stack([ring, np.full(n, height)])
+        faces.append(bottom)
+        faces.append(top)
+        # All side quads in one stacked array instead of a per-edge loop.
+        nxt = np.roll(np.arange(n), -1)
+        quads = np.stack([bottom, bottom[nxt], top[nxt], top], axis=1)
+        faces.extend(quads)
+        colors.extend([color] * (n + 2))
+    if faces:
+        ax.add_collection3d(Poly3DCollection(
+            faces, facecolors=colors, edgecolor='k', linewidths=0.3, alpha=0.6))
     ax.set_xlabel('X')
     ax.set_ylabel('Y')
     ax.set_zlabel('Height')
@@ -50,13 +159,49 @@ def generate_3d_image(polygons: List[List[Tuple[float, float]]], height: float =
     ax.set_xticks([])
     ax.set_yticks([])
     ax.set_zticks([])
-    buf = os.path.join('/tmp', 'extrusion.png')
-    fig.savefig(buf, format='png', bbox_inches='tight')
-    plt.close(fig)
-    img = Image.open(buf)
+    # Render straight into an RGBA buffer; a savefig/Image.open round-trip
+    # would pay PNG encode/decode plus disk I/O for an in-process image.
+    canvas.draw()
+    # Copy out of the Agg buffer: the figure lives on and its buffer is
+    # overwritten by the next render.
+    img = Image.fromarray(np.asarray(canvas.buffer_rgba()).copy())
     return img
 
 
+def _get_executor(app: "MeasureAppGUI") -> "ThreadPoolExecutor":
+    executor = getattr(app, '_3d_executor', None)
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=1)
+        app._3d_executor = executor
+    return executor
+
+
+def _poll_3d_future(app: "MeasureAppGUI", fut, top) -> None:
+    """Check the background render; reschedule until it finishes."""
+    if not top.winfo_exists():
+        # Window closed while rendering; drop the result when it arrives.
+        fut.cancel()
+        return
+    if not fut.done():
+        app.root.after(50, lambda: _poll_3d_future(app, fut, top))
+        return
+    try:
+        img3d = fut.result()
+    except Exception as e:
+        top.destroy()
+        from tkinter import messagebox
+        messagebox.showerror("Error", f"Failed to generate 3D view: {e}")
+        return
+    # PhotoImage creation must happen on the Tk thread
+    from PIL import ImageTk
+    for child in top.winfo_children():
+        child.destroy()
+    photo3d = ImageTk.PhotoImage(img3d)
+    lbl = tk.Label(top, image=photo3d)
+    lbl.image = photo3d
+    lbl.pack()
+
+
 def show_3d_view(app: "MeasureAppGUI") -> None:
     if not app.polygons:
         from tkinter import messagebox
@@ -65,24 +210,22 @@ def show_3d_view(app: "MeasureAppGUI") -> None:
     if app.image is None:
         return
     width, height_img = app.image.size
-    norm_polys: List[List[Tuple[float, float]]] = []
-    for poly in app.polygons:
-        pts = [(x / width, y / height_img) for (x, y) in poly.points]
-        norm_polys.append(pts)
+    # Normalize each polygon with one vectorized multiply rather than a
+    # per-vertex comprehension; as_array() reuses the cached ndarray and
+    # the multiply leaves that cache untouched.
+    scale = np.array([1.0 / width, 1.0 / height_img])
+    norm_polys = [poly.as_array() * scale for poly in app.polygons]
     height = float(app.config.get('extrusion_height', 1.0))
-    try:
-        img3d = generate_3d_image(norm_polys, height)
-        if tk is None:
-            return
-        top = tk.Toplevel(app.root)
-        top.title("3D View")
-        from PIL import ImageTk
-        photo3d = ImageTk.PhotoImage(img3d)
-        lbl = tk.Label(top, image=photo3d)
-        lbl.image = photo3d
-        lbl.pack()
-    except Exception as e:
-        from tkinter import messagebox
-        messagebox.showerror("Error", f"Failed to generate 3D view: {e}")
+    if tk is None:
+        return
+    # Render off the Tk thread so the event loop stays responsive; the
+    # Agg backend draws into a plain memory buffer, so no Tk or display
+    # state is touched until the finished image comes back here.
+    top = tk.Toplevel(app.root)
+    top.title("3D View")
+    placeholder = tk.Label(top, text="Rendering 3D view...")
+    placeholder.pack(padx=40, pady=40)
+    fut = _get_executor(app).submit(generate_3d_image, norm_polys, height)
+    app.root.after(50, lambda: _poll_3d_future(app, fut, top))
+
 
-